@@ -154,21 +154,24 @@ class AutotaskAuth:
             zone_url = f"{self.ZONE_INFO_URL}?user={self.credentials.username}"
             logger.info(f"Detecting Autotask API zone using: {zone_url}")
 
-            # Create a temporary session for zone detection
+            # Use a short-lived session for zone detection. The zone endpoint
+            # lives on a different host than the regional API, so its
+            # connection can't be reused by get_session(); close it as soon
+            # as the response has been read instead of leaking the socket.
             # Autotask REST API uses headers for authentication
-            session = requests.Session()
-            session.headers.update(
-                {
-                    "Content-Type": "application/json",
-                    "ApiIntegrationCode": self.credentials.integration_code,
-                    "UserName": self.credentials.username,
-                    "Secret": self.credentials.secret,
-                    "User-Agent": "py-autotask/2.0.0",
-                }
-            )
+            with requests.Session() as session:
+                session.headers.update(
+                    {
+                        "Content-Type": "application/json",
+                        "ApiIntegrationCode": self.credentials.integration_code,
+                        "UserName": self.credentials.username,
+                        "Secret": self.credentials.secret,
+                        "User-Agent": "py-autotask/2.0.0",
+                    }
+                )
 
-            # Allow redirects and log them
-            response = session.get(zone_url, timeout=30, allow_redirects=True)
+                # Allow redirects and log them
+                response = session.get(zone_url, timeout=30, allow_redirects=True)
 
             # Log if there was a redirect
             if response.history:
@@ -690,8 +690,12 @@ class AutotaskClient:
         if batch_size > 200:
             raise ValueError("Batch size cannot exceed 200 (API limit)")
 
+        if not entities_data:
+            return []
+
         results = []
         total_batches = (len(entities_data) + batch_size - 1) // batch_size
+        url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
 
         for i in range(0, len(entities_data), batch_size):
             batch = entities_data[i : i + batch_size]
@@ -701,8 +705,6 @@ class AutotaskClient:
                 f"Processing batch {batch_num}/{total_batches} ({len(batch)} entities)"
             )
 
-            url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
-
             try:
                 response = self.session.post(
                     url, json=batch, timeout=self.config.timeout
@@ -746,15 +748,22 @@ class AutotaskClient:
         if batch_size > 200:
             raise ValueError("Batch size cannot exceed 200 (API limit)")
 
-        # Validate all entities have ID
-        for i, entity_data in enumerate(entities_data):
-            if not entity_data.get("id"):
-                raise ValueError(
-                    f"Entity at index {i} missing 'id' field for batch update"
-                )
+        if not entities_data:
+            return []
+
+        # Validate all entities have ID, reporting every offender at once
+        missing = [i for i, data in enumerate(entities_data) if not data.get("id")]
+        if missing:
+            message = (
+                f"Entity at index {missing[0]} missing 'id' field for batch update"
+            )
+            if len(missing) > 1:
+                message += f" (all entities missing it: indices {missing})"
+            raise ValueError(message)
 
         results = []
         total_batches = (len(entities_data) + batch_size - 1) // batch_size
+        url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
 
         for i in range(0, len(entities_data), batch_size):
             batch = entities_data[i : i + batch_size]
@@ -764,8 +773,6 @@ class AutotaskClient:
                 f"Processing update batch {batch_num}/{total_batches} ({len(batch)} entities)"
             )
 
-            url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
-
             try:
                 response = self.session.patch(
                     url, json=batch, timeout=self.config.timeout
@@ -809,8 +816,12 @@ class AutotaskClient:
         if batch_size > 200:
             raise ValueError("Batch size cannot exceed 200 (API limit)")
 
+        if not entity_ids:
+            return []
+
         results = []
         total_batches = (len(entity_ids) + batch_size - 1) // batch_size
+        url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
 
         for i in range(0, len(entity_ids), batch_size):
             batch = entity_ids[i : i + batch_size]
@@ -820,8 +831,6 @@ class AutotaskClient:
                 f"Processing delete batch {batch_num}/{total_batches} ({len(batch)} entities)"
             )
 
-            url = f"{self.auth.api_url.rstrip('/')}/v1.0/{entity}/batch"
-
             try:
                 response = self.session.delete(
                     url, json={"ids": batch}, timeout=self.config.timeout
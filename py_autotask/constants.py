@@ -571,10 +571,10 @@ def get_status_name(status_class, status_value: int) -> str:
     Returns:
         String name of the status, or "UNKNOWN" if not found
     """
-    try:
-        return status_class(status_value).name
-    except ValueError:
-        return "UNKNOWN"
+    # Direct lookup in the enum's value map skips raising and catching
+    # ValueError for unknown values
+    member = status_class._value2member_map_.get(status_value)
+    return member.name if member is not None else "UNKNOWN"
 
 
 def get_priority_description(priority_value: int) -> str:
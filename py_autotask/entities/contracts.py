@@ -6,12 +6,44 @@ for contract management including billing, service tracking, milestones, renewal
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+from ..cache import MemoryCache
 from ..constants import ContractStatus, ContractType
 from ..types import ContractData, CreateResponse, QueryFilter, UpdateResponse
 from .base import BaseEntity
 
+# Contract types/statuses accepted by validate_contract_data
+_VALID_CONTRACT_TYPES = frozenset(
+    {
+        ContractType.RECURRING_SERVICE,
+        ContractType.TIME_AND_MATERIALS,
+        ContractType.FIXED_PRICE,
+    }
+)
+_VALID_CONTRACT_STATUSES = frozenset(
+    {
+        ContractStatus.ACTIVE,
+        ContractStatus.DRAFT,
+        ContractStatus.ON_HOLD,
+    }
+)
+
+
+def _is_allowed(value: Any, allowed: frozenset) -> bool:
+    """Check set membership, treating unhashable values as not allowed."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an Autotask ISO-8601 timestamp, memoized for repeat validations."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 # Re-export constants with names expected by tests and external code
 class ContractTypes:
@@ -80,6 +112,8 @@ class ContractDefaults:
     DEFAULT_AMENDMENT_APPROVAL_REQUIRED = True
     DEFAULT_RENEWAL_DAYS_AHEAD = 60
     DEFAULT_USAGE_PERIOD = "month"
+    METRICS_CACHE_SIZE = 512
+    METRICS_CACHE_TTL = 60  # seconds
 
 
 class ContractsEntity(BaseEntity):
@@ -96,9 +130,37 @@ class ContractsEntity(BaseEntity):
     - Comprehensive validation and analytics
     """
 
-    def __init__(self, client, entity_name: str = "Contracts"):
-        """Initialize the enhanced Contracts entity."""
+    # Metric methods whose results are cached per contract ID
+    _CACHED_METRICS = (
+        "calculate_contract_value",
+        "get_service_metrics",
+        "get_milestone_analytics",
+    )
+
+    def __init__(
+        self,
+        client,
+        entity_name: str = "Contracts",
+        metrics_cache_ttl: int = ContractDefaults.METRICS_CACHE_TTL,
+    ):
+        """
+        Initialize the enhanced Contracts entity.
+
+        Args:
+            client: The AutotaskClient instance
+            entity_name: Name of the entity in the API
+            metrics_cache_ttl: Seconds to reuse per-contract metrics in
+                summaries and health checks; 0 disables the cache
+        """
         super().__init__(client, entity_name)
+        # Short-lived cache of per-contract metrics so bursts of summary and
+        # health-check calls don't re-fetch the same billing/service data
+        self._metrics_cache: Optional[MemoryCache] = None
+        if metrics_cache_ttl > 0:
+            self._metrics_cache = MemoryCache(
+                max_size=ContractDefaults.METRICS_CACHE_SIZE,
+                default_ttl=metrics_cache_ttl,
+            )
 
     def create_contract(
         self,
@@ -216,7 +278,9 @@ class ContractsEntity(BaseEntity):
             **(invoice_data or {}),
         }
 
-        return self.client.create("Invoices", invoice_request)
+        response = self.client.create("Invoices", invoice_request)
+        self.clear_metrics_cache(contract_id)
+        return response
 
     def _get_default_billing_period(self) -> Dict[str, str]:
         """Get default billing period (current month)."""
@@ -457,7 +521,9 @@ class ContractsEntity(BaseEntity):
             **{k: v for k, v in service_data.items() if k not in required_fields},
         }
 
-        return self.client.create("ServiceDeliveryRecords", service_record)
+        response = self.client.create("ServiceDeliveryRecords", service_record)
+        self.clear_metrics_cache(contract_id)
+        return response
 
     def get_service_metrics(
         self,
@@ -709,7 +775,9 @@ class ContractsEntity(BaseEntity):
             },
         }
 
-        return self.client.create("ContractMilestones", milestone_record)
+        response = self.client.create("ContractMilestones", milestone_record)
+        self.clear_metrics_cache(contract_id)
+        return response
 
     def update_milestone_progress(
         self,
@@ -754,7 +822,10 @@ class ContractsEntity(BaseEntity):
         if progress_notes:
             update_data["progressNotes"] = progress_notes
 
-        return self.client.update("ContractMilestones", milestone_id, update_data)
+        response = self.client.update("ContractMilestones", milestone_id, update_data)
+        # Milestone records don't carry their contract here, so drop everything
+        self.clear_metrics_cache()
+        return response
 
     def get_upcoming_milestones(
         self,
@@ -1118,10 +1189,11 @@ class ContractsEntity(BaseEntity):
 
         # Create the renewal contract
         renewal_response = self.create(renewal_contract)
+        self.clear_metrics_cache(contract_id)
 
         # Update original contract status
         if renewal_response.get("success"):
-            self.update(
+            self.update_by_id(
                 contract_id,
                 {
                     "Status": ContractStatus.EXPIRED,
@@ -1354,7 +1426,9 @@ class ContractsEntity(BaseEntity):
             **{k: v for k, v in usage_data.items() if k not in required_fields},
         }
 
-        return self.client.create("ContractUsageRecords", usage_record)
+        response = self.client.create("ContractUsageRecords", usage_record)
+        self.clear_metrics_cache(contract_id)
+        return response
 
     def check_usage_limits(
         self,
@@ -1870,7 +1944,7 @@ class ContractsEntity(BaseEntity):
 
         # Update the contract with amendment changes
         if contract_updates:
-            self.update(contract_id, contract_updates)
+            self.update_by_id(contract_id, contract_updates)
 
     def get_contract_history(
         self,
@@ -2212,12 +2286,16 @@ class ContractsEntity(BaseEntity):
 
     # ======================================== Validation and Helper Methods
     # =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =  =
-    def validate_contract_data(self, contract_data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_contract_data(
+        self, contract_data: Dict[str, Any], fast_fail: bool = False
+    ) -> Dict[str, Any]:
         """
         Validate contract data before creation or update.
 
         Args:
             contract_data: Contract data to validate
+            fast_fail: Return as soon as required fields are found missing,
+                skipping the remaining checks (useful for bulk validation)
 
         Returns:
             Dictionary with validation results including errors and warnings
@@ -2231,11 +2309,14 @@ class ContractsEntity(BaseEntity):
 
         # Required field validation
         required_fields = ["ContractName", "AccountID"]
-        for field in required_fields:
-            if field not in contract_data or not contract_data[field]:
-                validation_result["errors"].append(
-                    f"Required field '{field}' is missing or empty"
-                )
+        validation_result["errors"].extend(
+            f"Required field '{field}' is missing or empty"
+            for field in required_fields
+            if not contract_data.get(field)
+        )
+        if fast_fail and validation_result["errors"]:
+            validation_result["is_valid"] = False
+            return validation_result
 
         # Contract name validation
         contract_name = contract_data.get("ContractName", "")
@@ -2255,8 +2336,8 @@ class ContractsEntity(BaseEntity):
 
         if start_date and end_date:
             try:
-                start_dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-                end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+                start_dt = _parse_iso_datetime(start_date)
+                end_dt = _parse_iso_datetime(end_date)
 
                 if end_dt <= start_dt:
                     validation_result["errors"].append(
@@ -2302,12 +2383,7 @@ class ContractsEntity(BaseEntity):
         # Contract type validation
         contract_type = contract_data.get("ContractType")
         if contract_type is not None:
-            valid_types = [
-                ContractType.RECURRING_SERVICE,
-                ContractType.TIME_AND_MATERIALS,
-                ContractType.FIXED_PRICE,
-            ]
-            if contract_type not in valid_types:
+            if not _is_allowed(contract_type, _VALID_CONTRACT_TYPES):
                 validation_result["errors"].append(
                     f"Invalid contract type: {contract_type}"
                 )
@@ -2315,12 +2391,7 @@ class ContractsEntity(BaseEntity):
         # Status validation
         status = contract_data.get("Status")
         if status is not None:
-            valid_statuses = [
-                ContractStatus.ACTIVE,
-                ContractStatus.DRAFT,
-                ContractStatus.ON_HOLD,
-            ]
-            if status not in valid_statuses:
+            if not _is_allowed(status, _VALID_CONTRACT_STATUSES):
                 validation_result["errors"].append(f"Invalid contract status: {status}")
 
         # Business logic recommendations
@@ -2359,17 +2430,23 @@ class ContractsEntity(BaseEntity):
 
         # Get related data
         try:
-            billing_data = self.calculate_contract_value(contract_id)
+            billing_data = self._get_cached_metric(
+                "calculate_contract_value", contract_id
+            )
         except Exception:
             billing_data = {"billed_to_date": 0, "remaining_value": 0}
 
         try:
-            service_metrics = self.get_service_metrics(contract_id)
+            service_metrics = self._get_cached_metric(
+                "get_service_metrics", contract_id
+            )
         except Exception:
             service_metrics = {"sla_compliance": {"compliance_rate": 0}}
 
         try:
-            milestone_analytics = self.get_milestone_analytics(contract_id)
+            milestone_analytics = self._get_cached_metric(
+                "get_milestone_analytics", contract_id
+            )
         except Exception:
             milestone_analytics = {"completion_rate": 0, "total_milestones": 0}
 
@@ -2430,7 +2507,7 @@ class ContractsEntity(BaseEntity):
         end_date = contract.get("EndDate")
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+                end_dt = _parse_iso_datetime(end_date)
                 days_remaining = (end_dt - datetime.now()).days
 
                 if days_remaining <= 30:
@@ -2494,7 +2571,9 @@ class ContractsEntity(BaseEntity):
 
         # Financial health check
         try:
-            billing_data = self.calculate_contract_value(contract_id)
+            billing_data = self._get_cached_metric(
+                "calculate_contract_value", contract_id
+            )
             utilization = billing_data.get("billing_utilization", 0)
 
             financial_score = 100
@@ -2528,7 +2607,9 @@ class ContractsEntity(BaseEntity):
 
         # Operational health check
         try:
-            service_metrics = self.get_service_metrics(contract_id)
+            service_metrics = self._get_cached_metric(
+                "get_service_metrics", contract_id
+            )
             sla_compliance = service_metrics.get("sla_compliance", {}).get(
                 "compliance_rate", 0
             )
@@ -2570,7 +2651,7 @@ class ContractsEntity(BaseEntity):
         end_date = contract.get("EndDate")
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+                end_dt = _parse_iso_datetime(end_date)
                 days_remaining = (end_dt - datetime.now()).days
 
                 if days_remaining <= 0:
@@ -2643,14 +2724,70 @@ class ContractsEntity(BaseEntity):
 
         return health_check
 
+    def update(self, entity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing contract and drop its cached metrics.
+
+        Args:
+            entity_data: Contract data including ID and fields to update
+
+        Returns:
+            Updated contract data
+        """
+        response = super().update(entity_data)
+        self.clear_metrics_cache(entity_data.get("id"))
+        return response
+
+    def update_by_id(
+        self, entity_id: int, update_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a contract by ID and drop its cached metrics.
+
+        Args:
+            entity_id: ID of contract to update
+            update_data: Data to update
+
+        Returns:
+            Updated contract data or None if not found
+        """
+        response = super().update_by_id(entity_id, update_data)
+        self.clear_metrics_cache(entity_id)
+        return response
+
+    def _get_cached_metric(self, method_name: str, contract_id: int) -> Dict[str, Any]:
+        """Return a per-contract metric, reusing a recent result when available."""
+        if self._metrics_cache is None:
+            return getattr(self, method_name)(contract_id)
+
+        cache_key = f"{method_name}:{contract_id}"
+        result = self._metrics_cache.get(cache_key)
+        if result is None:
+            result = getattr(self, method_name)(contract_id)
+            self._metrics_cache.set(cache_key, result)
+        return result
+
+    def clear_metrics_cache(self, contract_id: Optional[int] = None) -> None:
+        """
+        Drop cached contract metrics used by summaries and health checks.
+
+        Args:
+            contract_id: Contract to invalidate, or None to clear all contracts
+        """
+        if self._metrics_cache is None:
+            return
+
+        if contract_id is None:
+            self._metrics_cache.clear()
+            return
+
+        for method_name in self._CACHED_METRICS:
+            self._metrics_cache.delete(f"{method_name}:{contract_id}")
+
     def _validate_required_fields(
         self, data: Dict[str, Any], required_fields: List[str]
     ) -> None:
         """Helper method to validate required fields."""
-        missing_fields = [
-            field
-            for field in required_fields
-            if field not in data or data[field] is None
-        ]
+        missing_fields = [field for field in required_fields if data.get(field) is None]
         if missing_fields:
             raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
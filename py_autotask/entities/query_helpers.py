@@ -5,11 +5,18 @@ This module provides utilities to build consistent QueryFilter objects
 and handle common query patterns across all entities.
 """
 
+import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, List, Optional, Union
 
 from ..types import FilterOperation, QueryFilter
 
+# Grammar for legacy string filters such as "isActive eq true and name eq 'x'"
+_BOOL_SPLIT_RE = re.compile(r"\s+(and|or)\s+")
+_FILTER_CLAUSE_RE = re.compile(r"(\w+)\s+(\w+)\s+(.+)")
+_FILTER_LITERALS = {"true": True, "false": False, "null": None}
+
 
 def build_filter(
     field: str,
@@ -65,6 +72,12 @@ def build_active_filter(active: bool = True) -> QueryFilter:
     Returns:
         QueryFilter for active status
     """
+    return _active_filter(bool(active))
+
+
+@lru_cache(maxsize=2)
+def _active_filter(active: bool) -> QueryFilter:
+    # QueryFilter is frozen, so the two possible filters are built once
     return build_equality_filter("isActive", active)
 
 
@@ -143,15 +156,12 @@ def build_search_filters(
     Returns:
         List of QueryFilter objects for search (OR logic when used together)
     """
-    filters = []
-    operation = FilterOperation.CONTAINS
-
     # Note: Autotask API case sensitivity is handled server-side
     # We document the parameter but don't modify the search term
-    for field in fields:
-        filters.append(build_filter(field, operation, search_term))
-
-    return filters
+    return [
+        QueryFilter(field=field, op=FilterOperation.CONTAINS, value=search_term)
+        for field in fields
+    ]
 
 
 def build_in_filter(field: str, values: List[Any], udf: bool = False) -> QueryFilter:
@@ -204,7 +214,8 @@ def combine_filters(
         logic: Logic operator ("and" or "or") - currently only "and" is supported
 
     Returns:
-        List of QueryFilter objects
+        The given list itself; it is not copied, so callers that go on to
+        mutate it should pass a copy
     """
     if logic.lower() != "and":
         raise ValueError(
@@ -229,58 +240,47 @@ def convert_string_filter_to_query_filter(filter_string: str) -> List[QueryFilte
         convert_string_filter_to_query_filter("isActive eq true")
         convert_string_filter_to_query_filter("accountType eq 'Customer' and isActive eq true")
     """
-    import re
-
-    # Simple regex to parse filter strings
-    # This handles basic patterns like "field op value" and "field1 op1 value1 and field2 op2 value2"
     filters = []
 
-    # Split by 'and' first
-    and_parts = filter_string.split(" and ")
-
-    for part in and_parts:
-        # Split by 'or' if present
-        or_parts = part.split(" or ")
+    # _BOOL_SPLIT_RE captures the connectors, so clauses and connectors
+    # alternate: [clause, "and", clause, "or", clause, ...]
+    parts = _BOOL_SPLIT_RE.split(filter_string.strip())
+    connectors = [None] + parts[1::2]
 
-        if len(or_parts) > 1:
-            # This is complex OR logic - not easily convertible
-            # For now, we'll handle the first part and warn about the rest
-            part = or_parts[0]
+    for connector, clause in zip(connectors, parts[::2]):
+        if connector == "or":
+            # Complex OR logic is not easily convertible; only the first
+            # clause of an OR group is kept
             # TODO: Handle OR logic properly
+            continue
 
         # Parse individual filter: "field op value"
-        # Handle quoted values and unquoted values
-        match = re.match(r"(\w+)\s+(\w+)\s+(.+)", part.strip())
+        match = _FILTER_CLAUSE_RE.match(clause.strip())
         if match:
             field, op, value_str = match.groups()
-
-            # Parse value
-            value_str = value_str.strip()
-            if value_str.startswith("'") and value_str.endswith("'"):
-                # String value
-                value = value_str[1:-1]
-            elif value_str.lower() == "true":
-                value = True
-            elif value_str.lower() == "false":
-                value = False
-            elif value_str.lower() == "null":
-                value = None
-            else:
-                # Try to parse as number
-                try:
-                    if "." in value_str:
-                        value = float(value_str)
-                    else:
-                        value = int(value_str)
-                except ValueError:
-                    # Keep as string
-                    value = value_str
-
-            filters.append(build_filter(field, op, value))
+            filters.append(build_filter(field, op, _parse_filter_value(value_str)))
 
     return filters
 
 
+def _parse_filter_value(value_str: str) -> Any:
+    """Convert the value of a string filter clause to its Python type."""
+    value_str = value_str.strip()
+    if value_str.startswith("'") and value_str.endswith("'"):
+        # String value
+        return value_str[1:-1]
+
+    lowered = value_str.lower()
+    if lowered in _FILTER_LITERALS:
+        return _FILTER_LITERALS[lowered]
+
+    # Try to parse as number, otherwise keep as string
+    try:
+        return float(value_str) if "." in value_str else int(value_str)
+    except ValueError:
+        return value_str
+
+
 def build_parent_child_filter(
     parent_field: str,
     parent_id: int,
@@ -40,6 +40,12 @@ class QueryFilter(BaseModel):
     )
     udf: bool = Field(False, description="Whether this is a user-defined field")
 
+    class Config:
+        """Pydantic configuration."""
+
+        # Immutable so helpers can hand out shared instances safely
+        frozen = True
+
     def model_dump(self, **kwargs):
         """Override to ensure enum values are serialized as strings."""
         data = super().model_dump(**kwargs)
@@ -5,6 +5,7 @@ This module provides common fixtures and configuration for all tests,
 including mock clients, sample data, and test utilities.
 """
 
+from types import SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import Mock
 
@@ -14,6 +15,8 @@ from requests import Session
 
 from py_autotask import AutotaskClient
 from py_autotask.auth import AutotaskAuth
+from py_autotask.entities.companies import CompaniesEntity
+from py_autotask.entities.projects import ProjectsEntity
 from py_autotask.types import AuthCredentials, ZoneInfo
 
 
@@ -78,6 +81,61 @@ def mock_client(mock_auth):
     return client
 
 
+@pytest.fixture
+def projects_entity(mock_client):
+    """ProjectsEntity instance backed by the mock client."""
+    return ProjectsEntity(mock_client, "Projects")
+
+
+# AutotaskClient methods CompaniesEntity uses
+_COMPANIES_CLIENT_METHODS = ("create_entity", "update", "delete", "get", "query")
+
+
+@pytest.fixture(scope="class")
+def _shared_companies_client():
+    """Mock AutotaskClient built once per test class.
+
+    Limited to the client methods CompaniesEntity calls, so a stray
+    attribute raises instead of silently creating a child mock.
+    """
+    return Mock(spec_set=_COMPANIES_CLIENT_METHODS)
+
+
+@pytest.fixture(scope="class")
+def _shared_companies_entity(_shared_companies_client):
+    """CompaniesEntity built once per test class on the shared client."""
+    return CompaniesEntity(_shared_companies_client, "Companies")
+
+
+@pytest.fixture
+def companies_client(_shared_companies_client):
+    """Class-shared companies mock client, reset after every test.
+
+    The reset clears calls, return values and side effects, including
+    those of child mocks, so nothing leaks into the next test.
+    """
+    yield _shared_companies_client
+    _shared_companies_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def companies_entity(_shared_companies_entity, companies_client):
+    """Class-shared CompaniesEntity whose client is reset after every test."""
+    return _shared_companies_entity
+
+
+@pytest.fixture
+def update_result():
+    """Result of a mocked client update; entities pass it through."""
+    return SimpleNamespace(item_id=12345)
+
+
+@pytest.fixture
+def query_response():
+    """Factory for query response stand-ins; entities only read ``.items``."""
+    return lambda items: SimpleNamespace(items=items)
+
+
 @pytest.fixture
 def sample_ticket_data():
     """Sample ticket data for testing."""
@@ -5,6 +5,7 @@ This module tests batch create, update, and delete operations
 for all entity types through the client and entity classes.
 """
 
+import itertools
 from unittest.mock import Mock, patch
 
 import pytest
@@ -51,6 +52,16 @@ class TestBatchOperations:
 
         return client
 
+    @pytest.fixture
+    def partial_client(self, mock_client):
+        """Real AutotaskClient wired to the mocked session, auth and config."""
+        client = AutotaskClient.__new__(AutotaskClient)
+        client._session = mock_client._session
+        client.logger = mock_client.logger
+        client.auth = mock_client.auth
+        client.config = mock_client.config
+        return client
+
     @pytest.fixture
     def sample_entities_data(self):
         """Sample entity data for testing."""
@@ -81,7 +92,9 @@ class TestBatchOperations:
             {"id": 1003, "priority": 3, "status": 1},
         ]
 
-    def test_client_batch_create_success(self, mock_client, sample_entities_data):
+    def test_client_batch_create_success(
+        self, mock_client, partial_client, sample_entities_data
+    ):
         """Test successful batch create via client."""
         # Mock the HTTP response for the batch API
         mock_response = Mock()
@@ -95,20 +108,17 @@ class TestBatchOperations:
 
         mock_client._session.post.return_value = mock_response
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        results = client.batch_create("Tickets", sample_entities_data, batch_size=200)
+        results = partial_client.batch_create(
+            "Tickets", sample_entities_data, batch_size=200
+        )
 
         assert len(results) == 3
         assert all(result.item_id is not None for result in results)
         assert [r.item_id for r in results] == [12345, 12346, 12347]
 
-    def test_client_batch_create_with_errors(self, mock_client, sample_entities_data):
+    def test_client_batch_create_with_errors(
+        self, mock_client, partial_client, sample_entities_data
+    ):
         """Test batch create with some failures."""
         # Mock HTTP error on batch request
         mock_response = Mock()
@@ -119,32 +129,20 @@ class TestBatchOperations:
 
         mock_client._session.post.return_value = mock_response
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
         # Test that HTTP errors are handled
         with pytest.raises((requests.exceptions.HTTPError, AutotaskAPIError)):
-            client.batch_create("Tickets", sample_entities_data)
+            partial_client.batch_create("Tickets", sample_entities_data)
 
-    def test_client_batch_create_exceeds_batch_size(self, mock_client):
+    def test_client_batch_create_exceeds_batch_size(self, partial_client):
         """Test batch create with batch size exceeding limit."""
         large_data = [{"test": f"data{i}"} for i in range(250)]
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
         with pytest.raises(ValueError, match="Batch size cannot exceed 200"):
-            client.batch_create("Tickets", large_data, batch_size=250)
+            partial_client.batch_create("Tickets", large_data, batch_size=250)
 
-    def test_client_batch_update_success(self, mock_client, sample_update_data):
+    def test_client_batch_update_success(
+        self, mock_client, partial_client, sample_update_data
+    ):
         """Test successful batch update via client."""
         # Mock the HTTP response for the batch update API
         mock_response = Mock()
@@ -158,36 +156,26 @@ class TestBatchOperations:
 
         mock_client._session.patch.return_value = mock_response
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        results = client.batch_update("Tickets", sample_update_data)
+        results = partial_client.batch_update("Tickets", sample_update_data)
 
         assert len(results) == 3
         assert all("id" in result for result in results)
 
-    def test_client_batch_update_missing_ids(self, mock_client):
+    def test_client_batch_update_missing_ids(self, partial_client):
         """Test batch update with missing IDs."""
         data_without_ids = [
             {"priority": 1, "status": 8},  # Missing ID
             {"id": 1002, "priority": 2, "status": 5},
         ]
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
         with pytest.raises(ValueError, match="Entity at index 0 missing 'id' field"):
-            client.batch_update("Tickets", data_without_ids)
+            partial_client.batch_update("Tickets", data_without_ids)
+
+        # Every entity without an ID is reported, not just the first
+        with pytest.raises(ValueError, match=r"indices \[0, 2\]"):
+            partial_client.batch_update("Tickets", data_without_ids + [{"priority": 3}])
 
-    def test_client_batch_delete_success(self, mock_client):
+    def test_client_batch_delete_success(self, mock_client, partial_client):
         """Test successful batch delete via client."""
         entity_ids = [1001, 1002, 1003]
 
@@ -198,19 +186,12 @@ class TestBatchOperations:
 
         mock_client._session.delete.return_value = mock_response
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        results = client.batch_delete("Tickets", entity_ids)
+        results = partial_client.batch_delete("Tickets", entity_ids)
 
         assert len(results) == 3
         assert all(result is True for result in results)
 
-    def test_client_batch_delete_with_failures(self, mock_client):
+    def test_client_batch_delete_with_failures(self, mock_client, partial_client):
         """Test batch delete with some failures."""
         entity_ids = [1001, 1002, 1003]
 
@@ -223,14 +204,7 @@ class TestBatchOperations:
 
         mock_client._session.delete.return_value = mock_response
 
-        # Create properly mocked client instance
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        results = client.batch_delete("Tickets", entity_ids)
+        results = partial_client.batch_delete("Tickets", entity_ids)
 
         # Batch delete handles errors gracefully and returns False for failed deletions
         assert len(results) == 3
@@ -323,35 +297,31 @@ class TestBatchOperations:
         assert len(results) == 2
         assert all("id" in result for result in results)
 
-    def test_batch_create_with_batching(self, mock_client):
+    def test_batch_create_with_batching(self, mock_client, partial_client):
         """Test batch create with automatic batching."""
         # Create data that exceeds batch size
         large_data = [{"test": f"data{i}"} for i in range(250)]
 
-        # Mock HTTP response for batch API
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = [
-            {"itemId": i} for i in range(100)
-        ]  # Return 100 items per batch
+        # Answer each batch POST with one new ID per posted entity
+        item_ids = itertools.count(12345)
 
-        mock_client._session.post.return_value = mock_response
+        def post_batch(url, json, timeout):
+            response = Mock()
+            response.raise_for_status.return_value = None
+            response.json.return_value = [{"itemId": next(item_ids)} for _ in json]
+            return response
 
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
+        mock_client._session.post.side_effect = post_batch
 
-        results = client.batch_create("Tickets", large_data, batch_size=100)
+        results = partial_client.batch_create("Tickets", large_data, batch_size=100)
 
         # Should process in multiple batches (3 batches of 100, 100, 50 items each)
-        assert len(results) == 300  # 3 batches * 100 returned items per batch
+        assert mock_client._session.post.call_count == 3
+        assert [r.item_id for r in results] == list(range(12345, 12345 + 250))
 
     @patch("py_autotask.client.logger")
     def test_batch_progress_logging(
-        self, mock_logger, mock_client, sample_entities_data
+        self, mock_logger, mock_client, partial_client, sample_entities_data
     ):
         """Test that batch operations log progress."""
         # Mock HTTP response for batch API
@@ -366,18 +336,12 @@ class TestBatchOperations:
 
         mock_client._session.post.return_value = mock_response
 
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        client.batch_create("Tickets", sample_entities_data)
+        partial_client.batch_create("Tickets", sample_entities_data)
 
         # Verify module-level logger was called for progress
         assert mock_logger.info.called
 
-    def test_batch_error_handling(self, mock_client):
+    def test_batch_error_handling(self, mock_client, partial_client):
         """Test error handling in batch operations."""
         data = [{"test": "data1"}, {"test": "data2"}]
 
@@ -390,29 +354,23 @@ class TestBatchOperations:
 
         mock_client._session.post.return_value = mock_response
 
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
         # Should handle errors gracefully
         with pytest.raises((requests.exceptions.HTTPError, AutotaskAPIError)):
-            client.batch_create("Tickets", data)
+            partial_client.batch_create("Tickets", data)
 
-    def test_batch_empty_dataset(self, mock_client):
+    def test_batch_empty_dataset(self, mock_client, partial_client):
         """Test batch operations with empty dataset."""
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
 
-        results = client.batch_create("Tickets", [])
+        assert partial_client.batch_create("Tickets", []) == []
+        assert partial_client.batch_update("Tickets", []) == []
+        assert partial_client.batch_delete("Tickets", []) == []
 
-        assert results == []
+        # Empty input returns before any request is made
+        mock_client._session.post.assert_not_called()
+        mock_client._session.patch.assert_not_called()
+        mock_client._session.delete.assert_not_called()
 
-    def test_batch_single_item(self, mock_client):
+    def test_batch_single_item(self, mock_client, partial_client):
         """Test batch operations with single item."""
         data = [{"test": "single_item"}]
 
@@ -424,13 +382,7 @@ class TestBatchOperations:
 
         mock_client._session.post.return_value = mock_response
 
-        client = AutotaskClient.__new__(AutotaskClient)
-        client._session = mock_client._session
-        client.logger = mock_client.logger
-        client.auth = mock_client.auth
-        client.config = mock_client.config
-
-        results = client.batch_create("Tickets", data)
+        results = partial_client.batch_create("Tickets", data)
 
         assert len(results) == 1
         assert results[0].item_id == 12345
@@ -0,0 +1,356 @@
+"""
+Tests for CompaniesEntity core operations.
+
+This test suite covers:
+- Core CRUD operations
+- Company lifecycle management
+- Advanced search and filtering
+- Input validation
+
+Contacts, financial, contract, location, custom field, bulk and analytics
+helpers are covered in test_companies_relations.py.
+"""
+
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from py_autotask.constants import AccountType, FieldLengths
+
+# The class-scoped client and entity are built once per worker; keep the
+# module on one pytest-xdist worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group(name="companies_crud")
+
+# Update sent when a company is deactivated instead of deleted
+_SOFT_DELETE_UPDATE = MappingProxyType({"id": 12345, "Active": False})
+
+# Values one character over each validated field limit, built once at import
+_LONG_NAME = "x" * (FieldLengths.NAME_MAX + 1)
+_LONG_PHONE = "x" * (FieldLengths.PHONE_MAX + 1)
+_LONG_ADDRESS = "x" * (FieldLengths.ADDRESS_LINE_MAX + 1)
+_LONG_CITY = "x" * (FieldLengths.CITY_MAX + 1)
+# CompaniesEntity caps WebAddress at 255 characters
+_LONG_WEB_ADDRESS = "x" * 256
+
+# Creation cutoff passed to the prospect date filter
+_CREATED_SINCE = datetime(2023, 1, 1)
+
+
+class TestCompaniesCrud:
+    """Test cases for CompaniesEntity CRUD, lifecycle, search and validation."""
+
+    # =============================================================================
+    # Core CRUD Operations Tests
+    # =============================================================================
+
+    def test_create_company_basic(self, companies_entity, companies_client):
+        """Test basic company creation with required fields."""
+        companies_client.create_entity.return_value = SimpleNamespace(item_id=12345)
+
+        companies_entity.create_company("Acme Corporation")
+
+        companies_client.create_entity.assert_called_once()
+        call_args = companies_client.create_entity.call_args[0]
+        assert call_args[0] == "Companies"
+        company_data = call_args[1]
+        assert company_data["CompanyName"] == "Acme Corporation"
+        assert company_data["CompanyType"] == AccountType.CUSTOMER
+        assert company_data["Active"] is True
+
+    def test_create_company_comprehensive(self, companies_entity, companies_client):
+        """Test company creation with all optional fields."""
+        companies_client.create_entity.return_value = SimpleNamespace(item_id=12345)
+        custom_fields = {"UserDefinedField1": "Custom Value"}
+
+        companies_entity.create_company(
+            company_name="Acme Corporation",
+            company_type=AccountType.PROSPECT,
+            phone="555-123-4567",
+            address1="123 Business Ave",
+            city="New York",
+            state="NY",
+            postal_code="10001",
+            country="USA",
+            website="https://acme-corp.com",
+            owner_resource_id=100,
+            market_segment_id=1,
+            territory_id=5,
+            custom_fields=custom_fields,
+        )
+
+        companies_client.create_entity.assert_called_once()
+        company_data = companies_client.create_entity.call_args[0][1]
+        assert company_data["CompanyName"] == "Acme Corporation"
+        assert company_data["CompanyType"] == AccountType.PROSPECT
+        assert company_data["Phone"] == "555-123-4567"
+        assert company_data["Address1"] == "123 Business Ave"
+        assert company_data["WebAddress"] == "https://acme-corp.com"
+        assert company_data["OwnerResourceID"] == 100
+        assert company_data["UserDefinedField1"] == "Custom Value"
+
+    def test_create_company_validation_error(self, companies_entity):
+        """Test company creation with invalid name raises validation error."""
+        with pytest.raises(ValueError, match="Company name is required"):
+            companies_entity.create_company("")
+
+        with pytest.raises(ValueError, match="Company name must be"):
+            companies_entity.create_company(_LONG_NAME)
+
+    def test_update_company_basic(
+        self, companies_entity, companies_client, update_result
+    ):
+        """Test basic company update."""
+        companies_client.update.return_value = update_result
+        updates = {"Phone": "555-999-8888", "City": "Los Angeles"}
+
+        companies_entity.update_company(12345, updates)
+
+        expected_data = {"id": 12345, **updates}
+        companies_client.update.assert_called_once_with("Companies", expected_data)
+
+    def test_update_company_with_validation(
+        self, companies_entity, companies_client, update_result
+    ):
+        """Test company update with field validation."""
+        companies_client.update.return_value = update_result
+
+        # Valid update should work
+        updates = {"CompanyName": "Valid Name", "Phone": "555-123-4567"}
+        companies_entity.update_company(12345, updates, validate_fields=True)
+        companies_client.update.assert_called_once()
+
+        # Invalid update should raise error
+        invalid_updates = {"Phone": _LONG_PHONE}
+        with pytest.raises(ValueError, match="Phone number must be"):
+            companies_entity.update_company(
+                12345, invalid_updates, validate_fields=True
+            )
+
+    def test_delete_company_soft_delete(
+        self, companies_entity, companies_client, update_result
+    ):
+        """Test company soft delete (deactivation)."""
+        companies_client.update.return_value = update_result
+
+        result = companies_entity.delete_company(12345, force=False)
+
+        assert result is True
+        companies_client.update.assert_called_once_with(
+            "Companies", _SOFT_DELETE_UPDATE
+        )
+
+    def test_delete_company_hard_delete_fallback(
+        self, companies_entity, companies_client, update_result
+    ):
+        """Test company hard delete with fallback to soft delete."""
+        companies_client.delete.side_effect = Exception("Cannot delete")
+        companies_client.update.return_value = update_result
+
+        result = companies_entity.delete_company(12345, force=True)
+
+        assert result is True
+        companies_client.delete.assert_called_once_with("Companies", 12345)
+        companies_client.update.assert_called_once_with(
+            "Companies", _SOFT_DELETE_UPDATE
+        )
+
+    # =============================================================================
+    # Company Lifecycle Management Tests
+    # =============================================================================
+
+    @pytest.mark.parametrize(
+        "method,kwargs,expected_data",
+        [
+            (
+                "convert_prospect_to_customer",
+                {"conversion_notes": "Signed contract", "owner_resource_id": 200},
+                {
+                    "CompanyType": AccountType.CUSTOMER,
+                    "OwnerResourceID": 200,
+                    "Notes": "Signed contract",
+                },
+            ),
+            (
+                "convert_lead_to_prospect",
+                {"qualification_notes": "Qualified through discovery call"},
+                {
+                    "CompanyType": AccountType.PROSPECT,
+                    "Notes": "Qualified through discovery call",
+                },
+            ),
+            (
+                "deactivate_company",
+                {"reason": "Contract ended", "archive_data": True},
+                {"Active": False, "InactiveReason": "Contract ended"},
+            ),
+            ("reactivate_company", {}, {"Active": True}),
+        ],
+        ids=["prospect_to_customer", "lead_to_prospect", "deactivate", "reactivate"],
+    )
+    def test_lifecycle_update(
+        self,
+        companies_entity,
+        companies_client,
+        method,
+        kwargs,
+        expected_data,
+        update_result,
+    ):
+        """Test lifecycle changes issue a single update with the new state."""
+        companies_client.update.return_value = update_result
+
+        getattr(companies_entity, method)(12345, **kwargs)
+
+        companies_client.update.assert_called_once_with(
+            "Companies", {"id": 12345, **expected_data}
+        )
+
+    # =============================================================================
+    # Search and Query Operations Tests
+    # =============================================================================
+
+    @pytest.mark.parametrize(
+        "name,kwargs",
+        [
+            ("Acme Corporation", {"exact_match": True}),
+            (
+                "Acme",
+                {
+                    "exact_match": False,
+                    "active_only": False,
+                    "company_types": [AccountType.CUSTOMER, AccountType.PROSPECT],
+                },
+            ),
+        ],
+        ids=["exact_match", "partial_match"],
+    )
+    def test_search_companies_by_name(
+        self, companies_entity, monkeypatch, name, kwargs, query_response
+    ):
+        """Test searching companies by exact and partial name match."""
+        mock_response = query_response(
+            [{"id": 12345, "CompanyName": "Acme Corporation"}]
+        )
+        monkeypatch.setattr(companies_entity, "query", Mock(return_value=mock_response))
+
+        result = companies_entity.search_companies_by_name(name, **kwargs)
+
+        # The entity's query method should be called
+        companies_entity.query.assert_called_once()
+        assert len(result) == 1
+
+    def test_get_companies_by_type(
+        self, companies_entity, companies_client, query_response
+    ):
+        """Test getting companies by type."""
+        companies_client.query.return_value = query_response(
+            [{"id": 12345, "CompanyType": AccountType.CUSTOMER}]
+        )
+
+        result = companies_entity.get_companies_by_type(
+            AccountType.CUSTOMER, include_fields=["id", "CompanyName", "CompanyType"]
+        )
+
+        companies_client.query.assert_called_once()
+        assert len(result) == 1
+
+    def test_get_customer_companies_with_filters(
+        self, companies_entity, companies_client, query_response
+    ):
+        """Test getting customer companies with advanced filters."""
+        companies_client.query.return_value = query_response([])
+
+        result = companies_entity.get_customer_companies(
+            owner_resource_id=100, territory_id=5, limit=50
+        )
+
+        companies_client.query.assert_called_once()
+        assert len(result) == 0
+
+    def test_get_prospect_companies_with_date_filter(
+        self, companies_entity, companies_client, query_response
+    ):
+        """Test getting prospect companies with date filtering."""
+        companies_client.query.return_value = query_response([])
+
+        result = companies_entity.get_prospect_companies(
+            owner_resource_id=100, created_since=_CREATED_SINCE
+        )
+
+        companies_client.query.assert_called_once()
+        assert len(result) == 0
+
+    def test_get_companies_by_location(
+        self, companies_entity, companies_client, query_response
+    ):
+        """Test getting companies by location."""
+        companies_client.query.return_value = query_response([])
+
+        result = companies_entity.get_companies_by_location(
+            city="New York", state="NY", country="USA"
+        )
+
+        companies_client.query.assert_called_once()
+        assert len(result) == 0
+
+    def test_get_companies_by_location_no_criteria_error(self, companies_entity):
+        """Test error when no location criteria provided."""
+        with pytest.raises(
+            ValueError, match="At least one location criteria must be provided"
+        ):
+            companies_entity.get_companies_by_location()
+
+    # =============================================================================
+    # Validation Tests
+    # =============================================================================
+
+    def test_validate_company_name(self, companies_entity):
+        """Test company name validation."""
+        # Valid name should not raise error
+        companies_entity._validate_company_name("Valid Company Name")
+
+        # Empty name should raise error
+        with pytest.raises(ValueError, match="Company name is required"):
+            companies_entity._validate_company_name("")
+
+        with pytest.raises(ValueError, match="Company name is required"):
+            companies_entity._validate_company_name("   ")
+
+        # Too long name should raise error
+        with pytest.raises(ValueError, match="Company name must be"):
+            companies_entity._validate_company_name(_LONG_NAME)
+
+    def test_validate_company_updates(self, companies_entity):
+        """Test company update validation."""
+        # Valid updates should not raise error
+        valid_updates = {
+            "CompanyName": "Valid Name",
+            "Phone": "555-123-4567",
+            "WebAddress": "https://example.com",
+        }
+        companies_entity._validate_company_updates(valid_updates)
+
+        # Invalid phone should raise error
+        invalid_phone_updates = {"Phone": _LONG_PHONE}
+        with pytest.raises(ValueError, match="Phone number must be"):
+            companies_entity._validate_company_updates(invalid_phone_updates)
+
+        # Invalid website should raise error
+        invalid_web_updates = {"WebAddress": _LONG_WEB_ADDRESS}
+        with pytest.raises(ValueError, match="Website URL must be"):
+            companies_entity._validate_company_updates(invalid_web_updates)
+
+    def test_validate_address_field(self, companies_entity):
+        """Test address field validation."""
+        # Valid address field should not raise error
+        companies_entity._validate_address_field("Address1", "123 Main St")
+
+        # Too long address should raise error
+        with pytest.raises(ValueError, match="Address1 must be"):
+            companies_entity._validate_address_field("Address1", _LONG_ADDRESS)
+
+        # Test other address fields
+        with pytest.raises(ValueError, match="City must be"):
+            companies_entity._validate_address_field("City", _LONG_CITY)
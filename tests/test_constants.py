@@ -5,9 +5,12 @@ This module tests all constants, enums, and utility functions in the constants m
 to ensure they provide correct values and maintain backward compatibility.
 """
 
+from enum import IntEnum
+
 import pytest
 
-from py_autotask.constants import (  # API Configuration; Common Enums; Task Constants; Ticket Constants; Project Constants; Contract Constants; Resource Constants; Account Constants; Expense Report Constants; Time Entry Constants; Opportunity Constants; Quote Constants; Invoice Constants; Utility Functions; Legacy constants
+import py_autotask.constants
+from py_autotask.constants import (
     TASK_STATUS_COMPLETE,
     TASK_STATUS_IN_PROGRESS,
     TASK_STATUS_NEW,
@@ -49,6 +52,175 @@ from py_autotask.constants import (  # API Configuration; Common Enums; Task Con
 )
 
 
+def _enum_cases(enum_cls, expected):
+    """Build (member, value) params with readable ids from a name -> value map."""
+    return [
+        pytest.param(enum_cls[name], value, id=f"{enum_cls.__name__}.{name}")
+        for name, value in expected.items()
+    ]
+
+
+# Expected Autotask API values for each enum, one parametrized case per member
+_PRIORITY_CASES = _enum_cases(
+    Priority, {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4}
+)
+_TASK_STATUS_CASES = _enum_cases(
+    TaskStatus,
+    {"NEW": 1, "IN_PROGRESS": 2, "WAITING": 3, "CANCELLED": 4, "COMPLETE": 5},
+)
+_TASK_PRIORITY_CASES = _enum_cases(
+    TaskPriority, {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4}
+)
+_TICKET_STATUS_CASES = _enum_cases(
+    TicketStatus,
+    {"NEW": 1, "ASSIGNED": 2, "IN_PROGRESS": 3, "COMPLETE": 8, "CANCELLED": 9},
+)
+_TICKET_TYPE_CASES = _enum_cases(
+    TicketType,
+    {
+        "INCIDENT": 1,
+        "PROBLEM": 2,
+        "CHANGE_REQUEST": 3,
+        "SERVICE_REQUEST": 4,
+        "MAINTENANCE": 5,
+    },
+)
+_TICKET_PRIORITY_CASES = _enum_cases(
+    TicketPriority, {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4}
+)
+_PROJECT_STATUS_CASES = _enum_cases(
+    ProjectStatus,
+    {"NEW": 1, "IN_PROGRESS": 2, "ON_HOLD": 3, "CANCELLED": 4, "COMPLETE": 5},
+)
+_PROJECT_TYPE_CASES = _enum_cases(
+    ProjectType,
+    {
+        "FIXED_PRICE": 1,
+        "TIME_AND_MATERIALS": 2,
+        "RETAINER": 3,
+        "RECURRING_SERVICE": 4,
+        "MILESTONE": 5,
+    },
+)
+_CONTRACT_STATUS_CASES = _enum_cases(
+    ContractStatus,
+    {
+        "DRAFT": 1,
+        "ACTIVE": 2,
+        "ON_HOLD": 3,
+        "EXPIRED": 4,
+        "CANCELLED": 5,
+        "COMPLETE": 6,
+    },
+)
+_CONTRACT_TYPE_CASES = _enum_cases(
+    ContractType,
+    {
+        "RECURRING_SERVICE": 1,
+        "BLOCK_HOURS": 2,
+        "TIME_AND_MATERIALS": 3,
+        "FIXED_PRICE": 4,
+        "MAINTENANCE": 5,
+    },
+)
+_CONTRACT_BILLING_TYPE_CASES = _enum_cases(
+    ContractBillingType,
+    {"MONTHLY": 1, "QUARTERLY": 2, "SEMI_ANNUALLY": 3, "ANNUALLY": 4, "ONE_TIME": 5},
+)
+_RESOURCE_STATUS_CASES = _enum_cases(
+    ResourceStatus, {"ACTIVE": 1, "INACTIVE": 2, "TERMINATED": 3, "ON_LEAVE": 4}
+)
+_RESOURCE_TYPE_CASES = _enum_cases(
+    ResourceType, {"EMPLOYEE": 1, "CONTRACTOR": 2, "CONSULTANT": 3, "VENDOR": 4}
+)
+_ACCOUNT_STATUS_CASES = _enum_cases(
+    AccountStatus, {"ACTIVE": 1, "INACTIVE": 2, "PROSPECT": 3, "FORMER_CLIENT": 4}
+)
+_ACCOUNT_TYPE_CASES = _enum_cases(
+    AccountType, {"CUSTOMER": 1, "PROSPECT": 2, "PARTNER": 3, "VENDOR": 4, "LEAD": 5}
+)
+_EXPENSE_REPORT_STATUS_CASES = _enum_cases(
+    ExpenseReportStatus,
+    {"DRAFT": 1, "SUBMITTED": 2, "APPROVED": 3, "REJECTED": 4, "PAID": 5},
+)
+_TIME_ENTRY_TYPE_CASES = _enum_cases(
+    TimeEntryType,
+    {
+        "REGULAR": 1,
+        "OVERTIME": 2,
+        "DOUBLE_TIME": 3,
+        "HOLIDAY": 4,
+        "PTO": 5,
+        "SICK": 6,
+        "TRAINING": 7,
+    },
+)
+_TIME_ENTRY_STATUS_CASES = _enum_cases(
+    TimeEntryStatus,
+    {"DRAFT": 1, "SUBMITTED": 2, "APPROVED": 3, "REJECTED": 4, "INVOICED": 5},
+)
+_OPPORTUNITY_STATUS_CASES = _enum_cases(
+    OpportunityStatus, {"OPEN": 1, "WON": 2, "LOST": 3, "CANCELLED": 4}
+)
+_OPPORTUNITY_STAGE_CASES = _enum_cases(
+    OpportunityStage,
+    {"LEAD": 1, "QUALIFIED": 2, "PROPOSAL": 3, "NEGOTIATION": 4, "CLOSING": 5},
+)
+_QUOTE_STATUS_CASES = _enum_cases(
+    QuoteStatus, {"DRAFT": 1, "PENDING": 2, "ACCEPTED": 3, "REJECTED": 4, "EXPIRED": 5}
+)
+_INVOICE_STATUS_CASES = _enum_cases(
+    InvoiceStatus, {"DRAFT": 1, "SENT": 2, "PAID": 3, "OVERDUE": 4, "CANCELLED": 5}
+)
+
+
+# Every IntEnum defined in the constants module, found once at import so new
+# enums are checked for duplicate and non-positive values automatically
+_ALL_ENUMS = tuple(
+    obj
+    for obj in vars(py_autotask.constants).values()
+    if isinstance(obj, type) and issubclass(obj, IntEnum) and obj is not IntEnum
+)
+_ALL_ENUM_MEMBERS = [
+    pytest.param(enum_cls, item, id=f"{enum_cls.__name__}.{item.name}")
+    for enum_cls in _ALL_ENUMS
+    for item in enum_cls
+]
+
+# (filter name, status it must include); written out rather than derived from
+# STATUS_FILTERS so a dropped filter or status is caught
+_TASK_STATUS_FILTER_CASES = [
+    ("open", TaskStatus.NEW),
+    ("closed", TaskStatus.COMPLETE),
+    ("active", TaskStatus.IN_PROGRESS),
+    ("completed", TaskStatus.COMPLETE),
+    ("in_progress", TaskStatus.IN_PROGRESS),
+]
+
+# (status class, value, expected name) for get_status_name
+_STATUS_NAME_CASES = [
+    pytest.param(TaskStatus, 1, "NEW", id="TaskStatus-1"),
+    pytest.param(TaskStatus, 2, "IN_PROGRESS", id="TaskStatus-2"),
+    pytest.param(TaskStatus, 5, "COMPLETE", id="TaskStatus-5"),
+    pytest.param(TicketStatus, 1, "NEW", id="TicketStatus-1"),
+    pytest.param(TicketStatus, 8, "COMPLETE", id="TicketStatus-8"),
+    pytest.param(TaskStatus, 999, "UNKNOWN", id="TaskStatus-unknown"),
+    pytest.param(TicketStatus, -1, "UNKNOWN", id="TicketStatus-unknown"),
+]
+
+# (priority, text the description must contain) for get_priority_description
+_PRIORITY_DESCRIPTION_CASES = [
+    pytest.param(Priority.CRITICAL, "Critical", id="critical"),
+    pytest.param(Priority.LOW, "Low", id="low"),
+    pytest.param(999, "Unknown Priority (999)", id="unknown"),
+]
+
+# Value set of each enum, built once for the duplicate and membership checks
+_ENUM_VALUES = {
+    enum_cls: frozenset(item.value for item in enum_cls) for enum_cls in _ALL_ENUMS
+}
+
+
 class TestAPIConfiguration:
     """Test API configuration constants."""
 
@@ -78,38 +250,25 @@ class TestAPIConfiguration:
 class TestPriorityConstants:
     """Test priority-related constants."""
 
-    def test_priority_enum_values(self):
-        """Test that priority enum has correct values."""
-        assert Priority.CRITICAL == 1
-        assert Priority.HIGH == 2
-        assert Priority.MEDIUM == 3
-        assert Priority.LOW == 4
+    @pytest.mark.parametrize("member,value", _PRIORITY_CASES)
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
-    def test_priority_map_completeness(self):
-        """Test that all priorities have descriptions."""
-        for priority in Priority:
-            assert priority in PriorityMap.DESCRIPTIONS
-            assert isinstance(PriorityMap.DESCRIPTIONS[priority], str)
-            assert len(PriorityMap.DESCRIPTIONS[priority]) > 0
+    @pytest.mark.parametrize("priority", list(Priority), ids=lambda p: p.name)
+    def test_priority_map_completeness(self, priority):
+        """Test that every priority has a non-empty description."""
+        description = PriorityMap.DESCRIPTIONS.get(priority)
+        assert isinstance(description, str) and description
 
 
 class TestTaskConstants:
     """Test task-related constants."""
 
-    def test_task_status_values(self):
-        """Test task status enum values."""
-        assert TaskStatus.NEW == 1
-        assert TaskStatus.IN_PROGRESS == 2
-        assert TaskStatus.WAITING == 3
-        assert TaskStatus.CANCELLED == 4
-        assert TaskStatus.COMPLETE == 5
-
-    def test_task_priority_values(self):
-        """Test task priority enum values."""
-        assert TaskPriority.CRITICAL == 1
-        assert TaskPriority.HIGH == 2
-        assert TaskPriority.MEDIUM == 3
-        assert TaskPriority.LOW == 4
+    @pytest.mark.parametrize("member,value", _TASK_STATUS_CASES + _TASK_PRIORITY_CASES)
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
     def test_task_dependency_types(self):
         """Test task dependency type constants."""
@@ -127,17 +286,10 @@ class TestTaskConstants:
         assert TaskStatus.CANCELLED in TaskConstants.CLOSED_STATUSES
         assert TaskStatus.IN_PROGRESS in TaskConstants.ACTIVE_STATUSES
 
-    def test_task_status_filters(self):
-        """Test task status filters are properly defined."""
-        assert "open" in TaskConstants.STATUS_FILTERS
-        assert "closed" in TaskConstants.STATUS_FILTERS
-        assert "active" in TaskConstants.STATUS_FILTERS
-        assert "completed" in TaskConstants.STATUS_FILTERS
-        assert "in_progress" in TaskConstants.STATUS_FILTERS
-
-        # Check that filter values match expected statuses
-        assert TaskStatus.COMPLETE in TaskConstants.STATUS_FILTERS["completed"]
-        assert TaskStatus.IN_PROGRESS in TaskConstants.STATUS_FILTERS["in_progress"]
+    @pytest.mark.parametrize("name,member", _TASK_STATUS_FILTER_CASES)
+    def test_task_status_filter_membership(self, name, member):
+        """Test task status filters exist and contain their key statuses."""
+        assert member in TaskConstants.STATUS_FILTERS[name]
 
     def test_task_validation_constants(self):
         """Test task validation constants."""
@@ -152,28 +304,13 @@ class TestTaskConstants:
 class TestTicketConstants:
     """Test ticket-related constants."""
 
-    def test_ticket_status_values(self):
-        """Test ticket status enum values."""
-        assert TicketStatus.NEW == 1
-        assert TicketStatus.ASSIGNED == 2
-        assert TicketStatus.IN_PROGRESS == 3
-        assert TicketStatus.COMPLETE == 8
-        assert TicketStatus.CANCELLED == 9
-
-    def test_ticket_type_values(self):
-        """Test ticket type enum values."""
-        assert TicketType.INCIDENT == 1
-        assert TicketType.PROBLEM == 2
-        assert TicketType.CHANGE_REQUEST == 3
-        assert TicketType.SERVICE_REQUEST == 4
-        assert TicketType.MAINTENANCE == 5
-
-    def test_ticket_priority_values(self):
-        """Test ticket priority enum values."""
-        assert TicketPriority.CRITICAL == 1
-        assert TicketPriority.HIGH == 2
-        assert TicketPriority.MEDIUM == 3
-        assert TicketPriority.LOW == 4
+    @pytest.mark.parametrize(
+        "member,value",
+        _TICKET_STATUS_CASES + _TICKET_TYPE_CASES + _TICKET_PRIORITY_CASES,
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
     def test_ticket_status_groups(self):
         """Test ticket status groupings."""
@@ -198,21 +335,12 @@ class TestTicketConstants:
 class TestProjectConstants:
     """Test project-related constants."""
 
-    def test_project_status_values(self):
-        """Test project status enum values."""
-        assert ProjectStatus.NEW == 1
-        assert ProjectStatus.IN_PROGRESS == 2
-        assert ProjectStatus.ON_HOLD == 3
-        assert ProjectStatus.CANCELLED == 4
-        assert ProjectStatus.COMPLETE == 5
-
-    def test_project_type_values(self):
-        """Test project type enum values."""
-        assert ProjectType.FIXED_PRICE == 1
-        assert ProjectType.TIME_AND_MATERIALS == 2
-        assert ProjectType.RETAINER == 3
-        assert ProjectType.RECURRING_SERVICE == 4
-        assert ProjectType.MILESTONE == 5
+    @pytest.mark.parametrize(
+        "member,value", _PROJECT_STATUS_CASES + _PROJECT_TYPE_CASES
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
     def test_project_type_descriptions(self):
         """Test that all project types have descriptions."""
@@ -224,178 +352,103 @@ class TestProjectConstants:
 class TestContractConstants:
     """Test contract-related constants."""
 
-    def test_contract_status_values(self):
-        """Test contract status enum values."""
-        assert ContractStatus.DRAFT == 1
-        assert ContractStatus.ACTIVE == 2
-        assert ContractStatus.ON_HOLD == 3
-        assert ContractStatus.EXPIRED == 4
-        assert ContractStatus.CANCELLED == 5
-        assert ContractStatus.COMPLETE == 6
-
-    def test_contract_type_values(self):
-        """Test contract type enum values."""
-        assert ContractType.RECURRING_SERVICE == 1
-        assert ContractType.BLOCK_HOURS == 2
-        assert ContractType.TIME_AND_MATERIALS == 3
-        assert ContractType.FIXED_PRICE == 4
-        assert ContractType.MAINTENANCE == 5
-
-    def test_contract_billing_type_values(self):
-        """Test contract billing type enum values."""
-        assert ContractBillingType.MONTHLY == 1
-        assert ContractBillingType.QUARTERLY == 2
-        assert ContractBillingType.SEMI_ANNUALLY == 3
-        assert ContractBillingType.ANNUALLY == 4
-        assert ContractBillingType.ONE_TIME == 5
+    @pytest.mark.parametrize(
+        "member,value",
+        _CONTRACT_STATUS_CASES + _CONTRACT_TYPE_CASES + _CONTRACT_BILLING_TYPE_CASES,
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestResourceConstants:
     """Test resource-related constants."""
 
-    def test_resource_status_values(self):
-        """Test resource status enum values."""
-        assert ResourceStatus.ACTIVE == 1
-        assert ResourceStatus.INACTIVE == 2
-        assert ResourceStatus.TERMINATED == 3
-        assert ResourceStatus.ON_LEAVE == 4
-
-    def test_resource_type_values(self):
-        """Test resource type enum values."""
-        assert ResourceType.EMPLOYEE == 1
-        assert ResourceType.CONTRACTOR == 2
-        assert ResourceType.CONSULTANT == 3
-        assert ResourceType.VENDOR == 4
+    @pytest.mark.parametrize(
+        "member,value", _RESOURCE_STATUS_CASES + _RESOURCE_TYPE_CASES
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestAccountConstants:
     """Test account-related constants."""
 
-    def test_account_status_values(self):
-        """Test account status enum values."""
-        assert AccountStatus.ACTIVE == 1
-        assert AccountStatus.INACTIVE == 2
-        assert AccountStatus.PROSPECT == 3
-        assert AccountStatus.FORMER_CLIENT == 4
-
-    def test_account_type_values(self):
-        """Test account type enum values."""
-        assert AccountType.CUSTOMER == 1
-        assert AccountType.PROSPECT == 2
-        assert AccountType.PARTNER == 3
-        assert AccountType.VENDOR == 4
-        assert AccountType.LEAD == 5
+    @pytest.mark.parametrize(
+        "member,value", _ACCOUNT_STATUS_CASES + _ACCOUNT_TYPE_CASES
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestExpenseReportConstants:
     """Test expense report constants."""
 
-    def test_expense_report_status_values(self):
-        """Test expense report status enum values."""
-        assert ExpenseReportStatus.DRAFT == 1
-        assert ExpenseReportStatus.SUBMITTED == 2
-        assert ExpenseReportStatus.APPROVED == 3
-        assert ExpenseReportStatus.REJECTED == 4
-        assert ExpenseReportStatus.PAID == 5
+    @pytest.mark.parametrize("member,value", _EXPENSE_REPORT_STATUS_CASES)
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestTimeEntryConstants:
     """Test time entry constants."""
 
-    def test_time_entry_type_values(self):
-        """Test time entry type enum values."""
-        assert TimeEntryType.REGULAR == 1
-        assert TimeEntryType.OVERTIME == 2
-        assert TimeEntryType.DOUBLE_TIME == 3
-        assert TimeEntryType.HOLIDAY == 4
-        assert TimeEntryType.PTO == 5
-        assert TimeEntryType.SICK == 6
-        assert TimeEntryType.TRAINING == 7
-
-    def test_time_entry_status_values(self):
-        """Test time entry status enum values."""
-        assert TimeEntryStatus.DRAFT == 1
-        assert TimeEntryStatus.SUBMITTED == 2
-        assert TimeEntryStatus.APPROVED == 3
-        assert TimeEntryStatus.REJECTED == 4
-        assert TimeEntryStatus.INVOICED == 5
+    @pytest.mark.parametrize(
+        "member,value", _TIME_ENTRY_TYPE_CASES + _TIME_ENTRY_STATUS_CASES
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestOpportunityConstants:
     """Test opportunity constants."""
 
-    def test_opportunity_status_values(self):
-        """Test opportunity status enum values."""
-        assert OpportunityStatus.OPEN == 1
-        assert OpportunityStatus.WON == 2
-        assert OpportunityStatus.LOST == 3
-        assert OpportunityStatus.CANCELLED == 4
-
-    def test_opportunity_stage_values(self):
-        """Test opportunity stage enum values."""
-        assert OpportunityStage.LEAD == 1
-        assert OpportunityStage.QUALIFIED == 2
-        assert OpportunityStage.PROPOSAL == 3
-        assert OpportunityStage.NEGOTIATION == 4
-        assert OpportunityStage.CLOSING == 5
+    @pytest.mark.parametrize(
+        "member,value", _OPPORTUNITY_STATUS_CASES + _OPPORTUNITY_STAGE_CASES
+    )
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestQuoteConstants:
     """Test quote constants."""
 
-    def test_quote_status_values(self):
-        """Test quote status enum values."""
-        assert QuoteStatus.DRAFT == 1
-        assert QuoteStatus.PENDING == 2
-        assert QuoteStatus.ACCEPTED == 3
-        assert QuoteStatus.REJECTED == 4
-        assert QuoteStatus.EXPIRED == 5
+    @pytest.mark.parametrize("member,value", _QUOTE_STATUS_CASES)
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestInvoiceConstants:
     """Test invoice constants."""
 
-    def test_invoice_status_values(self):
-        """Test invoice status enum values."""
-        assert InvoiceStatus.DRAFT == 1
-        assert InvoiceStatus.SENT == 2
-        assert InvoiceStatus.PAID == 3
-        assert InvoiceStatus.OVERDUE == 4
-        assert InvoiceStatus.CANCELLED == 5
+    @pytest.mark.parametrize("member,value", _INVOICE_STATUS_CASES)
+    def test_enum_values(self, member, value):
+        """Test enum members keep their Autotask API values."""
+        assert member == value
 
 
 class TestUtilityFunctions:
     """Test utility functions in constants module."""
 
-    def test_get_status_name_valid(self):
-        """Test get_status_name with valid status values."""
-        assert get_status_name(TaskStatus, 1) == "NEW"
-        assert get_status_name(TaskStatus, 2) == "IN_PROGRESS"
-        assert get_status_name(TaskStatus, 5) == "COMPLETE"
-
-        assert get_status_name(TicketStatus, 1) == "NEW"
-        assert get_status_name(TicketStatus, 8) == "COMPLETE"
-
-    def test_get_status_name_invalid(self):
-        """Test get_status_name with invalid status values."""
-        assert get_status_name(TaskStatus, 999) == "UNKNOWN"
-        assert get_status_name(TicketStatus, -1) == "UNKNOWN"
-
-    def test_get_priority_description_valid(self):
-        """Test get_priority_description with valid priorities."""
-        desc = get_priority_description(Priority.CRITICAL)
+    @pytest.mark.parametrize(
+        "status_class,status_value,expected",
+        _STATUS_NAME_CASES,
+    )
+    def test_get_status_name(self, status_class, status_value, expected):
+        """Test get_status_name with valid and unknown status values."""
+        assert get_status_name(status_class, status_value) == expected
+
+    @pytest.mark.parametrize("priority,expected", _PRIORITY_DESCRIPTION_CASES)
+    def test_get_priority_description(self, priority, expected):
+        """Test get_priority_description with valid and unknown priorities."""
+        desc = get_priority_description(priority)
         assert isinstance(desc, str)
-        assert "Critical" in desc
-
-        desc = get_priority_description(Priority.LOW)
-        assert isinstance(desc, str)
-        assert "Low" in desc
-
-    def test_get_priority_description_invalid(self):
-        """Test get_priority_description with invalid priorities."""
-        desc = get_priority_description(999)
-        assert "Unknown Priority" in desc
-        assert "999" in desc
+        assert expected in desc
 
     def test_validate_status_filter_valid(self):
         """Test validate_status_filter with valid filters."""
@@ -442,72 +495,21 @@ class TestLegacyCompatibility:
 class TestEnumIntegrity:
     """Test enum integrity and consistency."""
 
-    def test_no_duplicate_values_in_enums(self):
+    @pytest.mark.parametrize("enum_cls", _ALL_ENUMS, ids=lambda cls: cls.__name__)
+    def test_no_duplicate_values_in_enums(self, enum_cls):
         """Test that enums don't have duplicate values."""
-        enums_to_test = [
-            TaskStatus,
-            TaskPriority,
-            TicketStatus,
-            TicketType,
-            TicketPriority,
-            ProjectStatus,
-            ProjectType,
-            ContractStatus,
-            ContractType,
-            ContractBillingType,
-            ResourceStatus,
-            ResourceType,
-            AccountStatus,
-            AccountType,
-            ExpenseReportStatus,
-            TimeEntryType,
-            TimeEntryStatus,
-            OpportunityStatus,
-            OpportunityStage,
-            QuoteStatus,
-            InvoiceStatus,
-        ]
-
-        for enum_class in enums_to_test:
-            values = [item.value for item in enum_class]
-            assert len(values) == len(
-                set(values)
-            ), f"Duplicate values in {enum_class.__name__}"
+        # __members__ includes aliases, which iteration and len() skip
+        assert len(enum_cls.__members__) == len(
+            _ENUM_VALUES[enum_cls]
+        ), f"Duplicate values in {enum_cls.__name__}"
 
-    def test_enum_values_are_positive_integers(self):
+    @pytest.mark.parametrize("enum_cls,item", _ALL_ENUM_MEMBERS)
+    def test_enum_values_are_positive_integers(self, enum_cls, item):
         """Test that all enum values are positive integers."""
-        enums_to_test = [
-            TaskStatus,
-            TaskPriority,
-            TicketStatus,
-            TicketType,
-            TicketPriority,
-            ProjectStatus,
-            ProjectType,
-            ContractStatus,
-            ContractType,
-            ContractBillingType,
-            ResourceStatus,
-            ResourceType,
-            AccountStatus,
-            AccountType,
-            ExpenseReportStatus,
-            TimeEntryType,
-            TimeEntryStatus,
-            OpportunityStatus,
-            OpportunityStage,
-            QuoteStatus,
-            InvoiceStatus,
-        ]
-
-        for enum_class in enums_to_test:
-            for item in enum_class:
-                assert isinstance(
-                    item.value, int
-                ), f"{enum_class.__name__}.{item.name} value is not int"
-                assert (
-                    item.value > 0
-                ), f"{enum_class.__name__}.{item.name} value is not positive"
+        assert isinstance(
+            item.value, int
+        ), f"{enum_cls.__name__}.{item.name} value is not int"
+        assert item.value > 0, f"{enum_cls.__name__}.{item.name} value is not positive"
 
 
 class TestStatusFilterConsistency:
@@ -527,7 +529,7 @@ class TestStatusFilterConsistency:
         for constants_class, status_enum in constants_with_filters:
             if hasattr(constants_class, "STATUS_FILTERS"):
                 status_filters = constants_class.STATUS_FILTERS
-                valid_values = [item.value for item in status_enum]
+                valid_values = _ENUM_VALUES[status_enum]
 
                 for filter_name, status_list in status_filters.items():
                     for status_value in status_list:
@@ -535,6 +537,21 @@ class TestStatusFilterConsistency:
                             status_value in valid_values
                         ), f"{constants_class.__name__} filter '{filter_name}' contains invalid status {status_value}"
 
+    def test_status_filter_names_are_lowercase(self):
+        """Test that filter names are stored lowercase for case-insensitive lookup."""
+        for constants_class in (
+            TaskConstants,
+            TicketConstants,
+            ProjectConstants,
+            ContractConstants,
+            ResourceConstants,
+            ExpenseReportConstants,
+        ):
+            for filter_name in constants_class.STATUS_FILTERS:
+                assert (
+                    filter_name == filter_name.lower()
+                ), f"{constants_class.__name__} filter '{filter_name}' is not lowercase"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -5,10 +5,11 @@ Tests all PSA features including billing, service tracking, milestones, renewals
 """
 
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from py_autotask.client import AutotaskClient
 from py_autotask.entities.contracts import (
     BillingMethods,
     ContractsEntity,
@@ -67,7 +68,7 @@ class TestBillingAndInvoicing:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_generate_invoice_success(self):
@@ -167,7 +168,7 @@ class TestServiceLevelTracking:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_track_service_delivery_success(self):
@@ -271,7 +272,7 @@ class TestMilestoneManagement:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_add_milestone_success(self):
@@ -418,7 +419,7 @@ class TestRenewalManagement:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_schedule_renewal_alert_success(self):
@@ -504,7 +505,7 @@ class TestRenewalManagement:
         }
         self.contracts.get = MagicMock(return_value=original_contract)
         self.contracts.create = MagicMock(return_value={"success": True, "id": 789})
-        self.contracts.update = MagicMock(return_value={"success": True})
+        self.contracts.update_by_id = MagicMock(return_value={"success": True})
 
         renewal_data = {"new_value": 60000}
 
@@ -521,7 +522,7 @@ class TestRenewalManagement:
         assert "Renewal" in create_call["ContractName"]
 
         # Check that original contract was updated
-        self.contracts.update.assert_called_once()
+        self.contracts.update_by_id.assert_called_once()
 
     def test_get_renewal_analytics(self):
         """Test renewal analytics generation."""
@@ -563,7 +564,7 @@ class TestUsageTracking:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_track_usage_success(self):
@@ -700,7 +701,7 @@ class TestContractModifications:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.client = MagicMock()
+        self.client = Mock(spec=AutotaskClient)
         self.contracts = ContractsEntity(self.client)
 
     def test_add_amendment_success(self):
@@ -856,12 +857,25 @@ class TestContractModifications:
 class TestValidationAndHelpers:
     """Test validation and helper methods."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = MagicMock()
-        self.contracts = ContractsEntity(self.client)
+    @pytest.fixture
+    def mock_client(self):
+        """Mock AutotaskClient for testing."""
+        return Mock(spec=AutotaskClient)
+
+    @pytest.fixture
+    def contracts(self, mock_client):
+        """ContractsEntity instance for testing.
+
+        Function-scoped because several tests replace entity methods.
+        """
+        return ContractsEntity(mock_client)
 
-    def test_validate_contract_data_valid(self):
+    @pytest.fixture
+    def stub(self):
+        """Factory for method stubs that only need a return value."""
+        return lambda return_value: Mock(return_value=return_value)
+
+    def test_validate_contract_data_valid(self, contracts):
         """Test validation with valid contract data."""
         valid_data = {
             "ContractName": "Test Contract",
@@ -873,26 +887,43 @@ class TestValidationAndHelpers:
             "Status": ContractStatuses.ACTIVE,
         }
 
-        result = self.contracts.validate_contract_data(valid_data)
+        result = contracts.validate_contract_data(valid_data)
 
         assert result["is_valid"] is True
         assert len(result["errors"]) == 0
 
-    def test_validate_contract_data_missing_required(self):
+    def test_validate_contract_data_missing_required(self, contracts):
         """Test validation with missing required fields."""
         invalid_data = {
             "ContractValue": 50000
             # Missing ContractName and AccountID
         }
 
-        result = self.contracts.validate_contract_data(invalid_data)
+        result = contracts.validate_contract_data(invalid_data)
 
         assert result["is_valid"] is False
         assert len(result["errors"]) == 2
         assert any("ContractName" in error for error in result["errors"])
         assert any("AccountID" in error for error in result["errors"])
 
-    def test_validate_contract_data_invalid_dates(self):
+    def test_validate_contract_data_fast_fail(self, contracts):
+        """Test fast_fail stops after the required-field check."""
+        invalid_data = {
+            "ContractName": "Test Contract",
+            "StartDate": "2024-06-01T00:00:00Z",
+            "EndDate": "2024-01-01T00:00:00Z",  # End before start
+        }
+
+        result = contracts.validate_contract_data(invalid_data, fast_fail=True)
+
+        assert result["is_valid"] is False
+        assert result["errors"] == ["Required field 'AccountID' is missing or empty"]
+
+        # Without fast_fail the date range is still checked
+        result = contracts.validate_contract_data(invalid_data)
+        assert "End date must be after start date" in result["errors"]
+
+    def test_validate_contract_data_invalid_dates(self, contracts):
         """Test validation with invalid date range."""
         invalid_data = {
             "ContractName": "Test Contract",
@@ -901,14 +932,50 @@ class TestValidationAndHelpers:
             "EndDate": "2024-01-01T00:00:00Z",  # End before start
         }
 
-        result = self.contracts.validate_contract_data(invalid_data)
+        result = contracts.validate_contract_data(invalid_data)
 
         assert result["is_valid"] is False
         assert any(
             "End date must be after start date" in error for error in result["errors"]
         )
 
-    def test_get_contract_summary(self):
+    def test_validate_contract_data_type_and_status(self, contracts):
+        """Test contract type/status checks against the precomputed sets."""
+        base_data = {"ContractName": "Test Contract", "AccountID": 123}
+
+        for contract_type in (1, 3, 4):
+            result = contracts.validate_contract_data(
+                {**base_data, "ContractType": contract_type}
+            )
+            assert not any("Invalid contract type" in e for e in result["errors"])
+
+        result = contracts.validate_contract_data({**base_data, "ContractType": 2})
+        assert "Invalid contract type: 2" in result["errors"]
+
+        for status in (1, 2, 3):
+            result = contracts.validate_contract_data({**base_data, "Status": status})
+            assert not any("Invalid contract status" in e for e in result["errors"])
+
+        result = contracts.validate_contract_data({**base_data, "Status": 5})
+        assert result["is_valid"] is False
+        assert "Invalid contract status: 5" in result["errors"]
+
+    def test_validate_contract_data_unhashable_type_and_status(self, contracts):
+        """Test unhashable type/status values are reported instead of raising."""
+        result = contracts.validate_contract_data(
+            {
+                "ContractName": "Test Contract",
+                "AccountID": 123,
+                "ContractType": [1],
+                "Status": {"id": 1},
+            }
+        )
+
+        assert result["is_valid"] is False
+        assert "Invalid contract type: [1]" in result["errors"]
+        assert "Invalid contract status: {'id': 1}" in result["errors"]
+
+    def test_get_contract_summary(self, contracts, stub):
         """Test contract summary generation."""
         mock_contract = {
             "id": 123,
@@ -918,11 +985,11 @@ class TestValidationAndHelpers:
             "ContractValue": 100000,
             "EndDate": (datetime.now() + timedelta(days=45)).isoformat(),
         }
-        self.contracts.get = MagicMock(return_value=mock_contract)
+        contracts.get = stub(mock_contract)
 
         # Mock related data
-        self.contracts.calculate_contract_value = MagicMock(
-            return_value={
+        contracts.calculate_contract_value = stub(
+            {
                 "contract_value": 100000,
                 "billed_to_date": 40000,
                 "remaining_value": 60000,
@@ -930,15 +997,15 @@ class TestValidationAndHelpers:
             }
         )
 
-        self.contracts.get_service_metrics = MagicMock(
-            return_value={"sla_compliance": {"compliance_rate": 92}}
+        contracts.get_service_metrics = stub(
+            {"sla_compliance": {"compliance_rate": 92}}
         )
 
-        self.contracts.get_milestone_analytics = MagicMock(
-            return_value={"completion_rate": 60, "total_milestones": 5}
+        contracts.get_milestone_analytics = stub(
+            {"completion_rate": 60, "total_milestones": 5}
         )
 
-        result = self.contracts.get_contract_summary(123)
+        result = contracts.get_contract_summary(123)
 
         assert result["contract_id"] == 123
         assert result["basic_info"]["name"] == "Test Contract"
@@ -947,31 +1014,29 @@ class TestValidationAndHelpers:
         assert result["health_indicators"]["sla_health"] == "good"
         assert result["health_indicators"]["renewal_urgency"] == "soon"
 
-    def test_get_contract_health_check(self):
+    def test_get_contract_health_check(self, contracts, stub):
         """Test comprehensive contract health check."""
         mock_contract = {
             "id": 123,
             "ContractName": "Test Contract",
             "EndDate": (datetime.now() + timedelta(days=15)).isoformat(),
         }
-        self.contracts.get = MagicMock(return_value=mock_contract)
+        contracts.get = stub(mock_contract)
 
         # Mock financial health data
-        self.contracts.calculate_contract_value = MagicMock(
-            return_value={"billing_utilization": 85, "payment_status": {"overdue": 0}}
+        contracts.calculate_contract_value = stub(
+            {"billing_utilization": 85, "payment_status": {"overdue": 0}}
         )
 
         # Mock service metrics
-        self.contracts.get_service_metrics = MagicMock(
-            return_value={"sla_compliance": {"compliance_rate": 88}}
+        contracts.get_service_metrics = stub(
+            {"sla_compliance": {"compliance_rate": 88}}
         )
 
         # Mock validation
-        self.contracts.validate_contract_data = MagicMock(
-            return_value={"is_valid": True, "errors": []}
-        )
+        contracts.validate_contract_data = stub({"is_valid": True, "errors": []})
 
-        result = self.contracts.get_contract_health_check(123)
+        result = contracts.get_contract_health_check(123)
 
         assert result["contract_id"] == 123
         assert result["overall_health"] in ["good", "needs_attention"]
@@ -983,13 +1048,86 @@ class TestValidationAndHelpers:
         # Lifecycle should be concerning due to expiry in 15 days
         assert result["checks"]["lifecycle_health"]["score"] == 60
 
-    def test_validate_required_fields_helper(self):
+    def test_contract_metrics_cached_between_calls(self, contracts, stub):
+        """Test summary and health check share cached per-contract metrics."""
+        contracts.get = stub({"id": 123, "ContractName": "Test"})
+        contracts.calculate_contract_value = stub({"billing_utilization": 85})
+        contracts.get_service_metrics = stub(
+            {"sla_compliance": {"compliance_rate": 95}}
+        )
+        contracts.get_milestone_analytics = stub(
+            {"completion_rate": 100, "total_milestones": 1}
+        )
+
+        contracts.get_contract_summary(123)
+        contracts.get_contract_health_check(123)
+
+        contracts.calculate_contract_value.assert_called_once_with(123)
+        contracts.get_service_metrics.assert_called_once_with(123)
+
+        contracts.clear_metrics_cache(123)
+        contracts.get_contract_summary(123)
+
+        assert contracts.calculate_contract_value.call_count == 2
+        assert contracts.get_milestone_analytics.call_count == 2
+
+    @pytest.mark.parametrize(
+        "apply_update",
+        [
+            pytest.param(
+                lambda contracts: contracts.update(
+                    {"id": 123, "ContractValue": 200000}
+                ),
+                id="update",
+            ),
+            pytest.param(
+                lambda contracts: contracts.update_by_id(
+                    123, {"ContractValue": 200000}
+                ),
+                id="update_by_id",
+            ),
+        ],
+    )
+    def test_contract_metrics_refreshed_after_update(
+        self, contracts, stub, apply_update
+    ):
+        """Test a summary fetched after an update does not reuse stale metrics."""
+        contracts.get = stub({"id": 123, "ContractName": "Test"})
+        contracts.calculate_contract_value = stub({"billing_utilization": 50})
+        contracts.get_service_metrics = stub({})
+        contracts.get_milestone_analytics = stub({})
+        contracts.client.update.return_value = {"item": {"id": 123}}
+
+        contracts.get_contract_summary(123)
+        contracts.calculate_contract_value.return_value = {"billing_utilization": 90}
+        apply_update(contracts)
+        result = contracts.get_contract_summary(123)
+
+        contracts.client.update.assert_called_once_with(
+            "Contracts", {"id": 123, "ContractValue": 200000}
+        )
+        assert result["financial_summary"]["billing_utilization"] == 90
+
+    def test_contract_metrics_cache_disabled_with_zero_ttl(self, mock_client, stub):
+        """Test metrics are fetched on every call when the cache TTL is 0."""
+        contracts = ContractsEntity(mock_client, metrics_cache_ttl=0)
+        contracts.get = stub({"id": 123, "ContractName": "Test"})
+        contracts.calculate_contract_value = stub({})
+        contracts.get_service_metrics = stub({})
+        contracts.get_milestone_analytics = stub({})
+
+        contracts.get_contract_summary(123)
+        contracts.get_contract_summary(123)
+
+        assert contracts.calculate_contract_value.call_count == 2
+
+    def test_validate_required_fields_helper(self, contracts):
         """Test the helper method for required field validation."""
         data = {"field1": "value1"}
         required_fields = ["field1", "field2", "field3"]
 
         with pytest.raises(ValueError, match="Missing required fields: field2, field3"):
-            self.contracts._validate_required_fields(data, required_fields)
+            contracts._validate_required_fields(data, required_fields)
 
 
 if __name__ == "__main__":
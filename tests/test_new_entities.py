@@ -9,6 +9,7 @@ and specialized operations.
 from unittest.mock import patch
 
 import pytest
+import requests
 
 try:
     import responses
@@ -99,224 +100,171 @@ from py_autotask.entities import (
     TicketNotesEntity,
     TicketSecondaryResourcesEntity,
 )
+from py_autotask.entities.base import BaseEntity
+
+# (entity name, entity class) for every entity covered by this module
+_NEW_ENTITIES = [
+    ("ActionTypes", ActionTypesEntity),
+    ("AdditionalInvoiceFieldValues", AdditionalInvoiceFieldValuesEntity),
+    ("APIUsageMetrics", APIUsageMetricsEntity),
+    ("Appointments", AppointmentsEntity),
+    ("AutomationRules", AutomationRulesEntity),
+    ("BackupConfiguration", BackupConfigurationEntity),
+    # Article related entities
+    ("ArticleAttachments", ArticleAttachmentsEntity),
+    (
+        "ArticleConfigurationItemCategoryAssociations",
+        ArticleConfigurationItemCategoryAssociationsEntity,
+    ),
+    ("ArticleNotes", ArticleNotesEntity),
+    ("ArticlePlainTextContent", ArticlePlainTextContentEntity),
+    ("ArticleTagAssociations", ArticleTagAssociationsEntity),
+    ("ArticleTicketAssociations", ArticleTicketAssociationsEntity),
+    ("ArticleToArticleAssociations", ArticleToArticleAssociationsEntity),
+    ("ArticleToDocumentAssociations", ArticleToDocumentAssociationsEntity),
+    # Company related entities
+    ("CompanyAlerts", CompanyAlertsEntity),
+    ("CompanyAttachments", CompanyAttachmentsEntity),
+    ("CompanyCategories", CompanyCategoriesEntity),
+    ("CompanyLocations", CompanyLocationsEntity),
+    ("CompanyNoteAttachments", CompanyNoteAttachmentsEntity),
+    ("CompanyNotes", CompanyNotesEntity),
+    ("CompanySiteConfigurations", CompanySiteConfigurationsEntity),
+    ("CompanyTeams", CompanyTeamsEntity),
+    ("CompanyToDos", CompanyToDosEntity),
+    # Configuration item related entities
+    ("ConfigurationItemAttachments", ConfigurationItemAttachmentsEntity),
+    (
+        "ConfigurationItemBillingProductAssociations",
+        ConfigurationItemBillingProductAssociationsEntity,
+    ),
+    ("ConfigurationItemCategories", ConfigurationItemCategoriesEntity),
+    (
+        "ConfigurationItemCategoryUdfAssociations",
+        ConfigurationItemCategoryUdfAssociationsEntity,
+    ),
+    ("ConfigurationItemDnsRecords", ConfigurationItemDnsRecordsEntity),
+    ("ConfigurationItemNoteAttachments", ConfigurationItemNoteAttachmentsEntity),
+    ("ConfigurationItemNotes", ConfigurationItemNotesEntity),
+    ("ConfigurationItemRelatedItems", ConfigurationItemRelatedItemsEntity),
+    (
+        "ConfigurationItemSslSubjectAlternativeName",
+        ConfigurationItemSslSubjectAlternativeNameEntity,
+    ),
+    # Contract related entities
+    ("ContractBillingRules", ContractBillingRulesEntity),
+    ("ContractBlockHourFactors", ContractBlockHourFactorsEntity),
+    ("ContractExclusionBillingCodes", ContractExclusionBillingCodesEntity),
+    ("ContractExclusionRoles", ContractExclusionRolesEntity),
+    ("ContractExclusionSetExcludedRoles", ContractExclusionSetExcludedRolesEntity),
+    (
+        "ContractExclusionSetExcludedWorkTypes",
+        ContractExclusionSetExcludedWorkTypesEntity,
+    ),
+    ("ContractMilestones", ContractMilestonesEntity),
+    ("ContractNotes", ContractNotesEntity),
+    ("ContractRetainers", ContractRetainersEntity),
+    ("ContractRoles", ContractRolesEntity),
+    ("ContractServiceAdjustments", ContractServiceAdjustmentsEntity),
+    # Ticket related entities
+    ("TicketAdditionalContacts", TicketAdditionalContactsEntity),
+    ("TicketAdditionalConfigurationItems", TicketAdditionalConfigurationItemsEntity),
+    ("TicketAttachments", TicketAttachmentsEntity),
+    ("TicketChangeRequestApprovals", TicketChangeRequestApprovalsEntity),
+    ("TicketChecklistItems", TicketChecklistItemsEntity),
+    ("TicketChecklistLibraries", TicketChecklistLibrariesEntity),
+    ("TicketCosts", TicketCostsEntity),
+    ("TicketHistory", TicketHistoryEntity),
+    ("TicketNotes", TicketNotesEntity),
+    ("TicketSecondaryResources", TicketSecondaryResourcesEntity),
+    # System related entities
+    ("SystemConfiguration", SystemConfigurationEntity),
+    ("SystemHealth", SystemHealthEntity),
+    ("SecurityPolicies", SecurityPoliciesEntity),
+    ("PerformanceMetrics", PerformanceMetricsEntity),
+    ("IntegrationEndpoints", IntegrationEndpointsEntity),
+    ("ComplianceFrameworks", ComplianceFrameworksEntity),
+    # Financial related entities
+    ("TaxCategories", TaxCategoriesEntity),
+    ("TaxRegions", TaxRegionsEntity),
+    ("PaymentTerms", PaymentTermsEntity),
+    ("Currencies", CurrenciesEntity),
+    # Inventory related entities
+    ("InventoryItems", InventoryItemsEntity),
+    ("InventoryLocations", InventoryLocationsEntity),
+    ("InventoryStockedItems", InventoryStockedItemsEntity),
+    ("InventoryTransfers", InventoryTransfersEntity),
+    # Price list related entities
+    ("PriceListMaterialCodes", PriceListMaterialCodesEntity),
+    ("PriceListProducts", PriceListProductsEntity),
+    ("PriceListRoles", PriceListRolesEntity),
+    ("PriceListServices", PriceListServicesEntity),
+    ("PriceListServiceBundles", PriceListServiceBundlesEntity),
+    ("PriceListWorkTypeModifiers", PriceListWorkTypeModifiersEntity),
+    # Resource related entities
+    ("ResourceAttachments", ResourceAttachmentsEntity),
+    ("ResourceRoleDepartments", ResourceRoleDepartmentsEntity),
+    ("ResourceRoleQueues", ResourceRoleQueuesEntity),
+    ("ResourceRoleSkills", ResourceRoleSkillsEntity),
+    ("ResourceServiceDeskRoles", ResourceServiceDeskRolesEntity),
+]
 
 
 class TestNewEntities:
     """Test cases for newly added entities."""
 
-    def test_action_types_entity(self, mock_auth):
-        """Test ActionTypesEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = ActionTypesEntity(client, "ActionTypes")
-
-        assert entity.entity_name == "ActionTypes"
-        assert entity.client is client
-        assert hasattr(entity, "get")
-        assert hasattr(entity, "query")
-        assert hasattr(entity, "create")
-
-    def test_additional_invoice_field_values_entity(self, mock_auth):
-        """Test AdditionalInvoiceFieldValuesEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = AdditionalInvoiceFieldValuesEntity(
-            client, "AdditionalInvoiceFieldValues"
-        )
-
-        assert entity.entity_name == "AdditionalInvoiceFieldValues"
+    @pytest.fixture
+    def client(self, mock_auth):
+        """AutotaskClient over the mocked auth; its session is created lazily."""
+        return AutotaskClient(mock_auth)
+
+    @pytest.mark.parametrize(
+        "entity_name,entity_class",
+        _NEW_ENTITIES,
+        ids=[entity_name for entity_name, _ in _NEW_ENTITIES],
+    )
+    def test_entity_construction(self, client, entity_name, entity_class):
+        """Test that each new entity binds its name and client."""
+        entity = entity_class(client, entity_name)
+
+        assert entity.entity_name == entity_name
         assert entity.client is client
 
-    def test_api_usage_metrics_entity(self, mock_auth):
-        """Test APIUsageMetricsEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = APIUsageMetricsEntity(client, "APIUsageMetrics")
-
-        assert entity.entity_name == "APIUsageMetrics"
-        assert entity.client is client
-
-    def test_appointments_entity(self, mock_auth):
-        """Test AppointmentsEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = AppointmentsEntity(client, "Appointments")
-
-        assert entity.entity_name == "Appointments"
-        assert entity.client is client
-
-    def test_article_entities(self, mock_auth):
-        """Test all article-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        article_entities = [
-            ("ArticleAttachments", ArticleAttachmentsEntity),
-            (
-                "ArticleConfigurationItemCategoryAssociations",
-                ArticleConfigurationItemCategoryAssociationsEntity,
-            ),
-            ("ArticleNotes", ArticleNotesEntity),
-            ("ArticlePlainTextContent", ArticlePlainTextContentEntity),
-            ("ArticleTagAssociations", ArticleTagAssociationsEntity),
-            ("ArticleTicketAssociations", ArticleTicketAssociationsEntity),
-            ("ArticleToArticleAssociations", ArticleToArticleAssociationsEntity),
-            ("ArticleToDocumentAssociations", ArticleToDocumentAssociationsEntity),
-        ]
-
-        for entity_name, entity_class in article_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_company_related_entities(self, mock_auth):
-        """Test all company-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        company_entities = [
-            ("CompanyAlerts", CompanyAlertsEntity),
-            ("CompanyAttachments", CompanyAttachmentsEntity),
-            ("CompanyCategories", CompanyCategoriesEntity),
-            ("CompanyLocations", CompanyLocationsEntity),
-            ("CompanyNoteAttachments", CompanyNoteAttachmentsEntity),
-            ("CompanyNotes", CompanyNotesEntity),
-            ("CompanySiteConfigurations", CompanySiteConfigurationsEntity),
-            ("CompanyTeams", CompanyTeamsEntity),
-            ("CompanyToDos", CompanyToDosEntity),
-        ]
-
-        for entity_name, entity_class in company_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_configuration_item_entities(self, mock_auth):
-        """Test all configuration item related entities."""
-        client = AutotaskClient(mock_auth)
-
-        ci_entities = [
-            ("ConfigurationItemAttachments", ConfigurationItemAttachmentsEntity),
-            (
-                "ConfigurationItemBillingProductAssociations",
-                ConfigurationItemBillingProductAssociationsEntity,
-            ),
-            ("ConfigurationItemCategories", ConfigurationItemCategoriesEntity),
-            (
-                "ConfigurationItemCategoryUdfAssociations",
-                ConfigurationItemCategoryUdfAssociationsEntity,
-            ),
-            ("ConfigurationItemDnsRecords", ConfigurationItemDnsRecordsEntity),
-            (
-                "ConfigurationItemNoteAttachments",
-                ConfigurationItemNoteAttachmentsEntity,
-            ),
-            ("ConfigurationItemNotes", ConfigurationItemNotesEntity),
-            ("ConfigurationItemRelatedItems", ConfigurationItemRelatedItemsEntity),
-            (
-                "ConfigurationItemSslSubjectAlternativeName",
-                ConfigurationItemSslSubjectAlternativeNameEntity,
-            ),
-        ]
-
-        for entity_name, entity_class in ci_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_contract_entities(self, mock_auth):
-        """Test all contract-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        contract_entities = [
-            ("ContractBillingRules", ContractBillingRulesEntity),
-            ("ContractBlockHourFactors", ContractBlockHourFactorsEntity),
-            ("ContractExclusionBillingCodes", ContractExclusionBillingCodesEntity),
-            ("ContractExclusionRoles", ContractExclusionRolesEntity),
-            (
-                "ContractExclusionSetExcludedRoles",
-                ContractExclusionSetExcludedRolesEntity,
-            ),
-            (
-                "ContractExclusionSetExcludedWorkTypes",
-                ContractExclusionSetExcludedWorkTypesEntity,
-            ),
-            ("ContractMilestones", ContractMilestonesEntity),
-            ("ContractNotes", ContractNotesEntity),
-            ("ContractRetainers", ContractRetainersEntity),
-            ("ContractRoles", ContractRolesEntity),
-            ("ContractServiceAdjustments", ContractServiceAdjustmentsEntity),
-        ]
-
-        for entity_name, entity_class in contract_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_ticket_related_entities(self, mock_auth):
-        """Test all ticket-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        ticket_entities = [
-            ("TicketAdditionalContacts", TicketAdditionalContactsEntity),
-            (
-                "TicketAdditionalConfigurationItems",
-                TicketAdditionalConfigurationItemsEntity,
-            ),
-            ("TicketAttachments", TicketAttachmentsEntity),
-            ("TicketChangeRequestApprovals", TicketChangeRequestApprovalsEntity),
-            ("TicketChecklistItems", TicketChecklistItemsEntity),
-            ("TicketChecklistLibraries", TicketChecklistLibrariesEntity),
-            ("TicketCosts", TicketCostsEntity),
-            ("TicketHistory", TicketHistoryEntity),
-            ("TicketNotes", TicketNotesEntity),
-            ("TicketSecondaryResources", TicketSecondaryResourcesEntity),
-        ]
-
-        for entity_name, entity_class in ticket_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    @pytest.mark.skipif(not HAS_RESPONSES, reason="responses library not available")
-    @responses.activate
-    def test_entity_crud_operations(self, mock_auth, sample_ticket_data):
-        """Test CRUD operations for new entities."""
+    @pytest.fixture
+    def action_types_api(self, mock_auth, sample_ticket_data, sample_query_response):
+        """Serve the ActionTypes CRUD and query endpoints from a responses mock."""
         if not HAS_RESPONSES:
             pytest.skip("responses library not available")
 
-        # Use fixed API URL for testing
-        api_url = "https://webservices123.autotask.net/atservicesrest"
-        mock_auth.api_url = api_url
-
-        # Make sure get_session returns a real Session that responses can intercept
-        import requests
-
+        # Give the client a real Session that responses can intercept
         mock_auth.get_session.return_value = requests.Session()
-
-        # Mock API responses
-        responses.add(
-            responses.GET,
-            f"{api_url}/v1.0/ActionTypes/12345",
-            json={"item": sample_ticket_data},
-            status=200,
-        )
-
-        responses.add(
-            responses.POST,
-            f"{api_url}/v1.0/ActionTypes",
-            json={"itemId": 12345},
-            status=201,
-        )
-
-        responses.add(
-            responses.PATCH,
-            f"{api_url}/v1.0/ActionTypes/12345",
-            json={"item": sample_ticket_data},
-            status=200,
-        )
-
-        responses.add(
-            responses.DELETE,
-            f"{api_url}/v1.0/ActionTypes/12345",
-            status=200,
-        )
-
-        client = AutotaskClient(mock_auth)
+        base_url = f"{mock_auth.api_url}/v1.0/ActionTypes"
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+            rsps.add(
+                responses.GET,
+                f"{base_url}/12345",
+                json={"item": sample_ticket_data},
+                status=200,
+            )
+            rsps.add(responses.POST, base_url, json={"itemId": 12345}, status=201)
+            rsps.add(
+                responses.PATCH,
+                f"{base_url}/12345",
+                json={"item": sample_ticket_data},
+                status=200,
+            )
+            rsps.add(responses.DELETE, f"{base_url}/12345", status=200)
+            rsps.add(
+                responses.POST,
+                f"{base_url}/query",
+                json=sample_query_response,
+                status=200,
+            )
+            yield rsps
+
+    def test_entity_crud_operations(self, client, action_types_api, sample_ticket_data):
+        """Test CRUD operations for new entities."""
         entity = ActionTypesEntity(client, "ActionTypes")
 
         # Test get
@@ -336,30 +284,10 @@ class TestNewEntities:
         delete_result = entity.delete(12345)
         assert delete_result is True
 
-    @pytest.mark.skipif(not HAS_RESPONSES, reason="responses library not available")
-    @responses.activate
-    def test_entity_query_operations(self, mock_auth, sample_query_response):
+    def test_entity_query_operations(
+        self, client, action_types_api, sample_query_response
+    ):
         """Test query operations for new entities."""
-        if not HAS_RESPONSES:
-            pytest.skip("responses library not available")
-
-        # Use fixed API URL for testing
-        api_url = "https://webservices123.autotask.net/atservicesrest"
-        mock_auth.api_url = api_url
-
-        # Make sure get_session returns a real Session that responses can intercept
-        import requests
-
-        mock_auth.get_session.return_value = requests.Session()
-
-        responses.add(
-            responses.POST,
-            f"{api_url}/v1.0/ActionTypes/query",
-            json=sample_query_response,
-            status=200,
-        )
-
-        client = AutotaskClient(mock_auth)
         entity = ActionTypesEntity(client, "ActionTypes")
 
         # Test query with filters
@@ -369,110 +297,8 @@ class TestNewEntities:
         assert result.items == sample_query_response["items"]
         assert len(result.items) == 1
 
-    def test_automation_rules_entity(self, mock_auth):
-        """Test AutomationRulesEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = AutomationRulesEntity(client, "AutomationRules")
-
-        assert entity.entity_name == "AutomationRules"
-        assert entity.client is client
-
-    def test_backup_configuration_entity(self, mock_auth):
-        """Test BackupConfigurationEntity functionality."""
-        client = AutotaskClient(mock_auth)
-        entity = BackupConfigurationEntity(client, "BackupConfiguration")
-
-        assert entity.entity_name == "BackupConfiguration"
-        assert entity.client is client
-
-    def test_system_entities(self, mock_auth):
-        """Test system-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        system_entities = [
-            ("SystemConfiguration", SystemConfigurationEntity),
-            ("SystemHealth", SystemHealthEntity),
-            ("SecurityPolicies", SecurityPoliciesEntity),
-            ("PerformanceMetrics", PerformanceMetricsEntity),
-            ("IntegrationEndpoints", IntegrationEndpointsEntity),
-            ("ComplianceFrameworks", ComplianceFrameworksEntity),
-        ]
-
-        for entity_name, entity_class in system_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_financial_entities(self, mock_auth):
-        """Test financial-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        financial_entities = [
-            ("TaxCategories", TaxCategoriesEntity),
-            ("TaxRegions", TaxRegionsEntity),
-            ("PaymentTerms", PaymentTermsEntity),
-            ("Currencies", CurrenciesEntity),
-        ]
-
-        for entity_name, entity_class in financial_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_inventory_entities(self, mock_auth):
-        """Test inventory-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        inventory_entities = [
-            ("InventoryItems", InventoryItemsEntity),
-            ("InventoryLocations", InventoryLocationsEntity),
-            ("InventoryStockedItems", InventoryStockedItemsEntity),
-            ("InventoryTransfers", InventoryTransfersEntity),
-        ]
-
-        for entity_name, entity_class in inventory_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_price_list_entities(self, mock_auth):
-        """Test price list related entities."""
-        client = AutotaskClient(mock_auth)
-
-        price_list_entities = [
-            ("PriceListMaterialCodes", PriceListMaterialCodesEntity),
-            ("PriceListProducts", PriceListProductsEntity),
-            ("PriceListRoles", PriceListRolesEntity),
-            ("PriceListServices", PriceListServicesEntity),
-            ("PriceListServiceBundles", PriceListServiceBundlesEntity),
-            ("PriceListWorkTypeModifiers", PriceListWorkTypeModifiersEntity),
-        ]
-
-        for entity_name, entity_class in price_list_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_resource_entities(self, mock_auth):
-        """Test resource-related entities."""
-        client = AutotaskClient(mock_auth)
-
-        resource_entities = [
-            ("ResourceAttachments", ResourceAttachmentsEntity),
-            ("ResourceRoleDepartments", ResourceRoleDepartmentsEntity),
-            ("ResourceRoleQueues", ResourceRoleQueuesEntity),
-            ("ResourceRoleSkills", ResourceRoleSkillsEntity),
-            ("ResourceServiceDeskRoles", ResourceServiceDeskRolesEntity),
-        ]
-
-        for entity_name, entity_class in resource_entities:
-            entity = entity_class(client, entity_name)
-            assert entity.entity_name == entity_name
-            assert entity.client is client
-
-    def test_entity_error_handling(self, mock_auth):
+    def test_entity_error_handling(self, client):
         """Test error handling in entity operations."""
-        client = AutotaskClient(mock_auth)
         entity = ActionTypesEntity(client, "ActionTypes")
 
         # Mock error responses
@@ -480,14 +306,13 @@ class TestNewEntities:
             with pytest.raises(Exception, match="API Error"):
                 entity.get(12345)
 
-    def test_entity_logging(self, mock_auth, caplog):
+    def test_entity_logging(self, client, caplog):
         """Test that entities log operations correctly."""
         import logging
 
         # Set log level to DEBUG to capture debug messages
         caplog.set_level(logging.DEBUG)
 
-        client = AutotaskClient(mock_auth)
         entity = ActionTypesEntity(client, "ActionTypes")
 
         # Mock the client.get method to return a valid response
@@ -497,24 +322,15 @@ class TestNewEntities:
         # Check that debug logging occurred
         assert "Getting ActionTypes with ID 12345" in caplog.text
 
-    def test_entity_inheritance(self, mock_auth):
+    def test_entity_inheritance(self):
         """Test that all new entities properly inherit from BaseEntity."""
-        from py_autotask.entities.base import BaseEntity
-
-        client = AutotaskClient(mock_auth)
-
-        # Test a sample of entities
-        test_entities = [
-            ActionTypesEntity(client, "ActionTypes"),
-            CompanyAlertsEntity(client, "CompanyAlerts"),
-            TicketNotesEntity(client, "TicketNotes"),
-            SystemHealthEntity(client, "SystemHealth"),
-        ]
-
-        for entity in test_entities:
-            assert isinstance(entity, BaseEntity)
-            assert hasattr(entity, "get")
-            assert hasattr(entity, "query")
-            assert hasattr(entity, "create")
-            assert hasattr(entity, "update")
-            assert hasattr(entity, "delete")
+        # Test a sample of entities; subclass checks need no instances
+        for entity_class in (
+            ActionTypesEntity,
+            CompanyAlertsEntity,
+            TicketNotesEntity,
+            SystemHealthEntity,
+        ):
+            assert issubclass(entity_class, BaseEntity)
+            for method in ("get", "query", "create", "update", "delete"):
+                assert callable(getattr(entity_class, method, None))
@@ -10,22 +10,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from py_autotask.entities.projects import ProjectsEntity
-
 
 class TestProjectsEntity:
     """Comprehensive test suite for ProjectsEntity."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Mock AutotaskClient for testing."""
-        return Mock()
-
-    @pytest.fixture
-    def projects_entity(self, mock_client):
-        """ProjectsEntity instance for testing."""
-        return ProjectsEntity(mock_client, "Projects")
-
     @pytest.fixture
     def sample_project_data(self):
         """Sample project data for testing."""
@@ -9,7 +9,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from py_autotask.entities.projects import ProjectConstants, ProjectsEntity
+from py_autotask.entities.projects import ProjectConstants
 from py_autotask.exceptions import AutotaskValidationError
 
 # This module exercises the unmerged "enhance-projects" feature (budgeting, cost
@@ -22,19 +22,6 @@ pytestmark = pytest.mark.skip(
 )
 
 
-@pytest.fixture
-def mock_client():
-    """Create a mock client for testing."""
-    client = Mock()
-    return client
-
-
-@pytest.fixture
-def projects_entity(mock_client):
-    """Create a ProjectsEntity instance with mocked client."""
-    return ProjectsEntity(mock_client, "Projects")
-
-
 @pytest.fixture
 def sample_project_data():
     """Sample project data for testing."""
@@ -10,6 +10,29 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock
 
+import pytest
+from pydantic import ValidationError
+
+from py_autotask.entities import (  # noqa: F401 - import smoke test
+    AccountsEntity,
+    CompaniesEntity,
+    ProjectsEntity,
+    ResourcesEntity,
+    TicketsEntity,
+)
+from py_autotask.entities.base import BaseEntity
+from py_autotask.entities.query_helpers import (
+    build_active_filter,
+    build_equality_filter,
+    build_gte_filter,
+    build_in_filter,
+    build_lte_filter,
+    build_null_filter,
+    build_search_filters,
+    combine_filters,
+)
+from py_autotask.types import FilterOperation
+
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -18,18 +41,6 @@ def test_query_helpers_functionality():
     """Test that query helpers produce correct output."""
     print("Testing query helper functionality...")
 
-    from py_autotask.entities.query_helpers import (
-        build_active_filter,
-        build_equality_filter,
-        build_gte_filter,
-        build_in_filter,
-        build_lte_filter,
-        build_null_filter,
-        build_search_filters,
-        combine_filters,
-    )
-    from py_autotask.types import FilterOperation
-
     # Test equality filter
     eq_filter = build_equality_filter("accountType", "Customer")
     assert eq_filter.field == "accountType"
@@ -42,6 +53,10 @@ def test_query_helpers_functionality():
     assert active_filter.field == "isActive"
     assert active_filter.op == FilterOperation.EQ
     assert active_filter.value is True
+    # Filters are immutable, so the active filter is a shared instance
+    assert build_active_filter(True) is active_filter
+    with pytest.raises(ValidationError):
+        active_filter.value = False
     print("  ✓ Active filter works")
 
     # Test null filter
@@ -76,6 +91,7 @@ def test_query_helpers_functionality():
     all_filters = [eq_filter, active_filter, null_filter]
     combined = combine_filters(all_filters)
     assert len(combined) == 3
+    assert combined is all_filters  # returned as-is, without a copy
     print("  ✓ Combine filters works")
 
     print("All query helper functionality tests passed!")
@@ -90,8 +106,6 @@ def test_entity_query_methods():
     mock_response = {"items": [{"id": 1, "name": "Test"}]}
 
     # Test AccountsEntity
-    from py_autotask.entities.accounts import AccountsEntity
-
     accounts = AccountsEntity(mock_client, "Accounts")
     accounts.query = Mock(return_value=mock_response["items"])
 
@@ -103,8 +117,6 @@ def test_entity_query_methods():
     print("  ✓ AccountsEntity uses new query patterns")
 
     # Test CompaniesEntity
-    from py_autotask.entities.companies import CompaniesEntity
-
     companies = CompaniesEntity(mock_client, "Companies")
     companies.query = Mock(return_value=mock_response["items"])
 
@@ -123,24 +135,11 @@ def test_backwards_compatibility():
     """Test that the changes don't break basic functionality."""
     print("\nTesting backwards compatibility...")
 
-    # Test that we can still import all entities
-    try:
-        from py_autotask.entities import (  # noqa: F401 - import smoke test
-            AccountsEntity,
-            CompaniesEntity,
-            ProjectsEntity,
-            ResourcesEntity,
-            TicketsEntity,
-        )
-
-        print("  ✓ Core entities import successfully")
-    except ImportError as e:
-        print(f"  ✗ Import error: {e}")
-        return False
+    # The core entities are imported at module level, so reaching this
+    # point means they still import
+    print("  ✓ Core entities import successfully")
 
     # Test that BaseEntity still works
-    from py_autotask.entities.base import BaseEntity
-
     mock_client = Mock()
     base_entity = BaseEntity(mock_client, "TestEntity")
     assert base_entity.entity_name == "TestEntity"
@@ -6,9 +6,12 @@ This script tests that all entities now use consistent QueryFilter patterns
 and that the query helpers work correctly.
 """
 
+import re
 import sys
 from pathlib import Path
 
+from py_autotask.entities.accounts import AccountsEntity
+from py_autotask.entities.companies import CompaniesEntity
 from py_autotask.entities.query_helpers import (
     build_active_filter,
     build_equality_filter,
@@ -20,11 +23,25 @@ from py_autotask.entities.query_helpers import (
     combine_filters,
     convert_string_filter_to_query_filter,
 )
+from py_autotask.entities.tickets import TicketsEntity  # noqa: F401 - import smoke
 from py_autotask.types import FilterOperation
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# String-based filter patterns that should no longer appear in entities.
+# Each is searched separately so overlapping matches are all reported.
+# Plain status_filter="..." style keyword arguments are not matched.
+_STRING_FILTER_PATTERNS = (
+    (re.compile(r'\.query\([^)]*filter=["\']'), '.query(filter="...")'),
+    (re.compile(r'\.query\([^)]*filter=f["\']'), '.query(filter=f"...")'),
+    (re.compile(r'filter=" and "\.join\('), 'filter=" and ".join(...)'),
+    (re.compile(r'filter=" or "\.join\('), 'filter=" or ".join(...)'),
+)
+_SCAN_SKIP_FILES = frozenset(
+    {"__init__.py", "base.py", "manager.py", "query_helpers.py"}
+)
+
 
 def test_query_helpers():
     """Test all query helper functions."""
@@ -92,6 +109,16 @@ def test_query_helpers():
     assert converted[0].value is True
     assert converted[1].field == "accountType"
     assert converted[1].value == "Customer"
+
+    # OR groups keep only their first clause; numbers and null are coerced
+    converted = convert_string_filter_to_query_filter(
+        "id gt 10 or id lt 2 and rate lte 1.5 and parentID eq null"
+    )
+    assert [(f.field, f.value) for f in converted] == [
+        ("id", 10),
+        ("rate", 1.5),
+        ("parentID", None),
+    ]
     print("  ✓ convert_string_filter_to_query_filter works")
 
     print("All query helper tests passed!")
@@ -101,26 +128,14 @@ def test_entity_imports():
     """Test that entities can import and use query helpers."""
     print("\nTesting entity imports...")
 
-    try:
-        from py_autotask.entities.accounts import AccountsEntity
-        from py_autotask.entities.companies import CompaniesEntity
-        from py_autotask.entities.tickets import (  # noqa: F401 - import smoke test
-            TicketsEntity,
-        )
-
-        print("  ✓ Core entities import successfully")
+    # The entities are imported at module level, so reaching this point
+    # means they still import
+    print("  ✓ Core entities import successfully")
 
-        # Test that they have the required methods (without instantiating)
-        assert hasattr(AccountsEntity, "get_customer_accounts")
-        assert hasattr(CompaniesEntity, "get_companies_by_type")
-        print("  ✓ Entity classes have expected methods")
-
-    except ImportError as e:
-        print(f"  ✗ Import error: {e}")
-        return False
-    except Exception as e:
-        print(f"  ✗ Other error: {e}")
-        return False
+    # Test that they have the required methods (without instantiating)
+    assert hasattr(AccountsEntity, "get_customer_accounts")
+    assert hasattr(CompaniesEntity, "get_companies_by_type")
+    print("  ✓ Entity classes have expected methods")
 
     print("All entity import tests passed!")
     return True
@@ -134,39 +149,13 @@ def scan_for_remaining_issues():
     issues_found = []
 
     for file_path in entities_dir.glob("*.py"):
-        if file_path.name in [
-            "__init__.py",
-            "base.py",
-            "manager.py",
-            "query_helpers.py",
-        ]:
+        if file_path.name in _SCAN_SKIP_FILES:
             continue
 
-        with open(file_path, "r") as f:
-            content = f.read()
-
-        # Check for remaining string patterns (exclude false positives like status_filter="...")
-        import re
-
-        # Match .query(filter="...) or .query(... filter="...) - the actual problematic pattern
-        if re.search(r'\.query\([^)]*filter=["\']', content):
-            issues_found.append(f'{file_path}: Contains .query(filter="...") pattern')
-
-        # Match .query(filter=f"...) or .query(... filter=f"...)
-        if re.search(r'\.query\([^)]*filter=f["\']', content):
-            issues_found.append(f'{file_path}: Contains .query(filter=f"...") pattern')
-
-        # Match filter=" and ".join( - string concatenation pattern
-        if 'filter=" and ".join(' in content:
-            issues_found.append(
-                f'{file_path}: Contains filter=" and ".join(...) pattern'
-            )
-
-        # Match filter=" or ".join( - string concatenation pattern
-        if 'filter=" or ".join(' in content:
-            issues_found.append(
-                f'{file_path}: Contains filter=" or ".join(...) pattern'
-            )
+        content = file_path.read_text()
+        for pattern, description in _STRING_FILTER_PATTERNS:
+            if pattern.search(content):
+                issues_found.append(f"{file_path}: Contains {description} pattern")
 
     if issues_found:
         print("  Issues found:")